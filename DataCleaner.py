@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
+import logging
 from scipy import signal
 
+logger = logging.getLogger(__name__)
+
 class BiometricDataCleaner:
     """
     Multi-stage cleaning pipeline for physiological data.
@@ -65,8 +68,7 @@ class BiometricDataCleaner:
         df = data.copy()
         original_count = len(df)
         
-        print(f"\n🧹 Cleaning {self.metric_type} data...")
-        print(f"  Original: {original_count} samples")
+        logger.info(f"Cleaning {self.metric_type} data: {original_count} samples")
         
         # STAGE 1: Remove invalid values
         if stages.get('remove_invalid', True):
@@ -99,10 +101,108 @@ class BiometricDataCleaner:
         final_count = len(df)
         removed = original_count - final_count
         pct = (removed / original_count * 100) if original_count > 0 else 0
-        print(f"  Final: {final_count} samples ({removed} removed, {pct:.1f}%)")
+        logger.info(f"Cleaned {self.metric_type}: {final_count} samples ({removed} removed, {pct:.1f}%)")
         
         return df
-    
+
+    def clean_arrays(self, values, timestamps, stages=None):
+        """
+        Array counterpart of clean() for a single metric column.
+
+        Runs the same stages on the values without building a DataFrame.
+        Removed samples are returned as NaN rather than dropped, so the
+        result stays aligned with the input and can be written straight
+        back into the source rows.
+
+        Args:
+            values: 1-D array of metric values
+            timestamps: 1-D array of numeric timestamps, same length as values
+            stages: Dict with boolean flags for each stage, as in clean()
+
+        Returns:
+            float64 array of cleaned values, NaN where a sample was removed
+        """
+        if stages is None:
+            stages = {
+                'remove_invalid': True,
+                'remove_physiological_outliers': True,
+                'remove_statistical_outliers': False,
+                'remove_sudden_changes': True,
+                'interpolate': True,
+                'smooth': False
+            }
+
+        values = np.array(values, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        original_count = len(values)
+
+        logger.info(f"Cleaning {self.metric_type} data: {original_count} samples")
+
+        # Indices of the samples still kept, in timestamp order once sorted
+        kept = np.arange(original_count)
+
+        # STAGE 1: Remove invalid values
+        if stages.get('remove_invalid', True):
+            valid = np.isfinite(values)
+            if self.metric_type in ['EDA', 'PI', 'PR', 'PG']:
+                valid &= values >= 0
+            kept = kept[valid]
+
+        # STAGE 2: Remove physiological outliers
+        if stages.get('remove_physiological_outliers', True):
+            v = values[kept]
+            if self.thresholds['min'] is not None:
+                kept = kept[v >= self.thresholds['min']]
+                v = values[kept]
+            if self.thresholds['max'] is not None:
+                kept = kept[v <= self.thresholds['max']]
+
+        # STAGE 3: Remove statistical outliers
+        if stages.get('remove_statistical_outliers', False) and len(kept) > 0:
+            v = pd.Series(values[kept])
+            median = v.median()
+            mad = np.median(np.abs(v - median))
+            if mad == 0:
+                std = v.std()
+                if std > 0:
+                    kept = kept[(np.abs((v - median) / std) < 3.5).to_numpy()]
+            else:
+                kept = kept[(np.abs(0.6745 * (v - median) / mad) < 3.5).to_numpy()]
+
+        # STAGE 4: Remove sudden jumps
+        if stages.get('remove_sudden_changes', True) and self.thresholds['max_change'] is not None:
+            kept = kept[np.argsort(timestamps[kept], kind='stable')]
+            if len(kept) > 1:
+                time_diff = np.diff(timestamps[kept])
+                time_diff[time_diff == 0] = np.nan
+                with np.errstate(invalid='ignore'):
+                    rate_of_change = np.abs(np.diff(values[kept])) / time_diff
+                    keep = np.ones(len(kept), dtype=bool)
+                    keep[1:] = (rate_of_change <= self.thresholds['max_change']) | np.isnan(rate_of_change)
+                kept = kept[keep]
+
+        cleaned = values[kept]
+
+        # STAGE 5: Interpolate missing values
+        if stages.get('interpolate', True) and np.isnan(cleaned).any():
+            series = pd.Series(cleaned).interpolate(method='linear', limit=10)
+            cleaned = series.bfill(limit=5).ffill(limit=5).to_numpy()
+        has_value = ~np.isnan(cleaned)
+        kept, cleaned = kept[has_value], cleaned[has_value]
+
+        # STAGE 6: Apply smoothing
+        if stages.get('smooth', False) and len(cleaned) > 5:
+            cleaned = signal.medfilt(cleaned, kernel_size=5)
+
+        result = np.full(original_count, np.nan)
+        result[kept] = cleaned
+
+        removed = original_count - len(kept)
+        pct = (removed / original_count * 100) if original_count > 0 else 0
+        logger.info(f"Cleaned {self.metric_type}: {len(kept)} samples ({removed} removed, {pct:.1f}%)")
+
+        return result
+
     def _remove_invalid_values(self, df, metric_col):
         """Remove NaN, inf, and negative values (for metrics that must be positive)"""
         before = len(df)
@@ -119,7 +219,7 @@ class BiometricDataCleaner:
         
         removed = before - len(df)
         if removed > 0:
-            print(f"    Removed {removed} invalid values (NaN/inf/negative)")
+            logger.debug(f"Removed {removed} invalid values (NaN/inf/negative)")
         
         return df
     
@@ -135,7 +235,7 @@ class BiometricDataCleaner:
         
         removed = before - len(df)
         if removed > 0:
-            print(f"    Removed {removed} physiological outliers (range: {self.thresholds['min']}-{self.thresholds['max']})")
+            logger.debug(f"Removed {removed} physiological outliers (range: {self.thresholds['min']}-{self.thresholds['max']})")
         
         return df
     
@@ -159,7 +259,7 @@ class BiometricDataCleaner:
         
         removed = before - len(df)
         if removed > 0:
-            print(f"    Removed {removed} statistical outliers (modified z-score > {threshold})")
+            logger.debug(f"Removed {removed} statistical outliers (modified z-score > {threshold})")
         
         return df
     
@@ -182,7 +282,7 @@ class BiometricDataCleaner:
         
         removed = before - len(df)
         if removed > 0:
-            print(f"    Removed {removed} sudden changes (rate > {max_change}/sec)")
+            logger.debug(f"Removed {removed} sudden changes (rate > {max_change}/sec)")
         
         return df
     
@@ -202,7 +302,7 @@ class BiometricDataCleaner:
             interpolated = before_nan - after_nan
             
             if interpolated > 0:
-                print(f"    Interpolated {interpolated} missing values")
+                logger.debug(f"Interpolated {interpolated} missing values")
             
             # Drop any remaining NaN
             df = df.dropna(subset=[metric_col])
@@ -212,8 +312,8 @@ class BiometricDataCleaner:
     def _apply_smoothing(self, df, metric_col, window=5):
         """Apply median filter for noise reduction"""
         if len(df) > window:
-            df[metric_col] = signal.medfilt(df[metric_col].values, kernel_size=window)
-            print(f"Applied median filter (window={window})")
+            df[metric_col] = signal.medfilt(df[metric_col].to_numpy(), kernel_size=window)
+            logger.debug(f"Applied median filter (window={window})")
         
         return df
 
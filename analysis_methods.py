@@ -1,6 +1,5 @@
 import pandas as pd
 import numpy as np
-from scipy import signal
 
 def apply_analysis_method(data, metric_col, method='raw', **kwargs):
     """
@@ -100,10 +99,8 @@ def apply_rmssd(data, metric_col):
     Returns:
         DataFrame with RMSSD values (successive differences)
     """
-    result = data.copy()
-    
     # Calculate successive differences
-    values = result[metric_col].values
+    values = data[metric_col].to_numpy()
     successive_diffs = np.diff(values)
     
     # Calculate RMSSD
@@ -112,7 +109,7 @@ def apply_rmssd(data, metric_col):
     
     # Store successive differences as the transformed metric
     # Note: This will have one less data point than original
-    result = result.iloc[:-1].copy()  # Remove last row to match diff length
+    result = data.iloc[:-1].copy()  # Remove last row to match diff length
     result[metric_col] = successive_diffs
     
     # Add RMSSD as metadata (will be used in statistics)
@@ -121,6 +118,108 @@ def apply_rmssd(data, metric_col):
     return result
 
 
+def apply_group_analysis_method(group_data, metric_col, method='raw', **kwargs):
+    """
+    Apply an analysis method to several groups in one grouped pass.
+    Produces the same frames as calling apply_analysis_method() per group.
+    
+    Args:
+        group_data: Dict of {group_label: DataFrame}
+        metric_col: Name of the column containing metric values
+        method: Analysis method to apply ('raw', 'mean', 'moving_average', 'rmssd')
+        **kwargs: Additional parameters for specific methods
+        
+    Returns:
+        Dict of {group_label: processed DataFrame}, in group_data order
+    """
+    if method not in ('raw', 'mean', 'moving_average', 'rmssd'):
+        raise ValueError(f"Unknown analysis method: {method}")
+    
+    if len(group_data) == 0:
+        return {}
+    
+    labels = list(group_data.keys())
+    frames = [group_data[label] for label in labels]
+    
+    if method == 'raw':
+        return {label: data.copy() for label, data in zip(labels, frames)}
+    
+    lengths = np.array([len(data) for data in frames])
+    values = np.concatenate([data[metric_col].to_numpy() for data in frames])
+    transformed, transformed_lengths, rmssd = _transform_groups(values, lengths, method, **kwargs)
+    
+    results = {}
+    
+    if method == 'mean':
+        codes = np.repeat(np.arange(len(labels)), lengths)
+        timestamps = pd.Series(np.concatenate([data['AdjustedTimestamp'].to_numpy() for data in frames]))
+        timestamp_means = timestamps.groupby(codes).mean().reindex(np.arange(len(labels)))
+        for code, label in enumerate(labels):
+            results[label] = pd.DataFrame({
+                'AdjustedTimestamp': [timestamp_means.iloc[code]],
+                metric_col: [transformed[code]]
+            })
+        return results
+    
+    bounds = np.concatenate(([0], np.cumsum(transformed_lengths)))
+    for code, label in enumerate(labels):
+        # rmssd drops the last row of each group to match the diff length
+        result = frames[code].iloc[:transformed_lengths[code]].copy()
+        result[metric_col] = transformed[bounds[code]:bounds[code + 1]]
+        if rmssd is not None:
+            result.attrs['rmssd'] = rmssd[code]
+        results[label] = result
+    
+    return results
+
+
+def _transform_groups(values, lengths, method, **kwargs):
+    """
+    Grouped transform shared by apply_group_analysis_method() and
+    calculate_group_method_statistics().
+    
+    Args:
+        values: Concatenated metric values of all groups
+        lengths: Number of values in each group
+        method: 'mean', 'moving_average' or 'rmssd'
+        
+    Returns:
+        Tuple of (transformed values, their length per group,
+        rmssd per group or None)
+    """
+    n_groups = len(lengths)
+    bounds = np.concatenate(([0], np.cumsum(lengths)))
+    codes = np.repeat(np.arange(n_groups), lengths)
+    
+    if method == 'mean':
+        # One value per group; NaN for an empty group
+        means = pd.Series(values).groupby(codes).mean().reindex(np.arange(n_groups))
+        return means.to_numpy(), np.ones(n_groups, dtype=int), None
+    
+    if method == 'moving_average':
+        window_size = kwargs.get('window_size', 30)
+        smoothed = pd.Series(values).groupby(codes).rolling(
+            window=window_size,
+            center=True,
+            min_periods=1
+        ).mean().to_numpy()
+        return smoothed, lengths, None
+    
+    # rmssd: successive differences within each group; the first row of
+    # every group has no predecessor and is dropped
+    diffs = np.diff(values, prepend=values[:1])
+    keep = np.ones(len(values), dtype=bool)
+    keep[bounds[:-1][lengths > 0]] = False
+    diff_codes = codes[keep]
+    diffs = diffs[keep]
+    # bincount sums propagate NaN like np.mean does in apply_rmssd
+    square_sums = np.bincount(diff_codes, weights=diffs ** 2, minlength=n_groups)
+    diff_counts = np.bincount(diff_codes, minlength=n_groups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_squares = square_sums / diff_counts
+    return diffs, np.maximum(lengths - 1, 0), np.sqrt(mean_squares)
+
+
 def calculate_statistics(data, metric_col, method='raw'):
     """
     Calculate statistics appropriate for the analysis method.
@@ -179,6 +278,122 @@ def calculate_statistics(data, metric_col, method='raw'):
     return stats
 
 
+def calculate_group_statistics(group_data, metric_col, method='raw'):
+    """
+    Calculate statistics for several groups in one grouped pass.
+    Produces the same values as calling calculate_statistics() per group.
+    
+    Args:
+        group_data: Dict of {group_label: DataFrame}
+        metric_col: Name of the column containing metric values
+        method: Analysis method used
+        
+    Returns:
+        Dict of {group_label: statistics dict}, in group_data order
+    """
+    if len(group_data) == 0:
+        return {}
+    
+    labels = list(group_data.keys())
+    # Contiguous float64 buffers: masked/sliced frames can hand back strided
+    # views, and integer columns are accumulated as floats
+    columns = [
+        np.ascontiguousarray(group_data[label][metric_col].to_numpy(), dtype=np.float64)
+        for label in labels
+    ]
+    
+    rmssd = None
+    if method == 'rmssd':
+        rmssd = [group_data[label].attrs.get('rmssd') for label in labels]
+    
+    return _aggregate_group_statistics(
+        labels, np.concatenate(columns), [len(column) for column in columns], method, rmssd
+    )
+
+
+def calculate_group_method_statistics(group_data, metric_col, method='raw', **kwargs):
+    """
+    Apply an analysis method and calculate its statistics in one grouped pass,
+    without building the processed DataFrame of each group. Produces the same
+    values as apply_group_analysis_method() followed by
+    calculate_group_statistics(); use it when the processed data is not plotted.
+    
+    Args:
+        group_data: Dict of {group_label: DataFrame}
+        metric_col: Name of the column containing metric values
+        method: Analysis method to apply ('raw', 'mean', 'moving_average', 'rmssd')
+        **kwargs: Additional parameters for specific methods
+        
+    Returns:
+        Dict of {group_label: statistics dict}, in group_data order
+    """
+    if method not in ('raw', 'mean', 'moving_average', 'rmssd'):
+        raise ValueError(f"Unknown analysis method: {method}")
+    
+    if method == 'raw':
+        return calculate_group_statistics(group_data, metric_col, method)
+    
+    if len(group_data) == 0:
+        return {}
+    
+    labels = list(group_data.keys())
+    lengths = np.array([len(group_data[label]) for label in labels])
+    values = np.concatenate([group_data[label][metric_col].to_numpy() for label in labels])
+    transformed, transformed_lengths, rmssd = _transform_groups(values, lengths, method, **kwargs)
+    
+    return _aggregate_group_statistics(
+        labels, np.asarray(transformed, dtype=np.float64), transformed_lengths, method, rmssd
+    )
+
+
+def _aggregate_group_statistics(labels, values, lengths, method, rmssd=None):
+    """
+    Statistics dicts for consecutive runs of values, one run per label.
+    rmssd, if given, holds each group's RMSSD (None where unknown).
+    """
+    # Long form: one value column plus the integer group code of each row
+    codes = np.repeat(np.arange(len(labels)), lengths)
+    aggregated = pd.Series(values).groupby(codes).agg(['mean', 'std', 'min', 'max', 'count'])
+    aggregated = aggregated.reindex(np.arange(len(labels)))
+    
+    all_stats = {}
+    for code, label in enumerate(labels):
+        row = aggregated.iloc[code]
+        count = 0 if pd.isna(row['count']) else int(row['count'])
+        
+        if count == 0:
+            all_stats[label] = {
+                'mean': 0,
+                'std': 0,
+                'min': 0,
+                'max': 0,
+                'count': 0
+            }
+            continue
+        
+        mean_val = float(row['mean'])
+        std_val = float(row['std'])
+        
+        # Same NaN -> 0 mapping as calculate_statistics
+        stats = {
+            'mean': 0.0 if np.isnan(mean_val) else mean_val,
+            'std': 0.0 if np.isnan(std_val) else std_val,
+            'min': 0.0 if np.isnan(row['min']) else float(row['min']),
+            'max': 0.0 if np.isnan(row['max']) else float(row['max']),
+            'count': count
+        }
+        
+        if method == 'rmssd' and rmssd is not None and rmssd[code] is not None:
+            stats['rmssd'] = float(rmssd[code])
+        
+        if method == 'moving_average':
+            stats['smoothness'] = float(std_val / mean_val) if mean_val != 0 else 0
+        
+        all_stats[label] = stats
+    
+    return all_stats
+
+
 def get_method_label(method):
     """
     Get human-readable label for analysis method.
@@ -1,38 +1,309 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
 import os
 import json
+import re
+import hashlib
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-import neurokit2 as nk
 
 from analysis_utils import (
     prepare_event_markers_timestamps,
     find_timestamp_offset,
-    extract_window_data,
+    extract_windows_batch,
     get_subject_files,           
-    find_metric_file_for_subject  
+    find_metric_file_for_subject,
+    read_csv_files_concurrently,
+    read_metric_csv
 )
 
 from analysis_methods import (
-    apply_analysis_method,
-    calculate_statistics,
+    apply_group_analysis_method,
+    calculate_group_statistics,
+    calculate_group_method_statistics,
     get_method_label
 )
 
-from plot_generator import (
-    generate_plot,
-    generate_comparison_plot
+logger = logging.getLogger(__name__)
+
+# HRV domains in the column order nk.hrv() concatenates them, mapped to the
+# neurokit2 function names (resolved at call time, see _neurokit())
+HRV_DOMAIN_FUNCTIONS = {
+    'time': 'hrv_time',
+    'frequency': 'hrv_frequency',
+    'nonlinear': 'hrv_nonlinear'
+}
+
+# Frequency-domain HRV (Welch PSD of the RR series) is skipped for recordings
+# shorter than this, or with fewer peaks, where LF/HF estimates are not
+# meaningful. Its indices are then reported as None.
+HRV_MIN_FREQUENCY_MINUTES = 2
+HRV_MIN_FREQUENCY_PEAKS = 20
+HRV_FREQUENCY_INDICES = (
+    'HRV_ULF', 'HRV_VLF', 'HRV_LF', 'HRV_HF', 'HRV_VHF',
+    'HRV_TP', 'HRV_LFHF', 'HRV_LFn', 'HRV_HFn', 'HRV_LnHF'
+)
+
+# Columns read from Vernier respiratory and Polar H10 cardiac files
+RESPIRATORY_COLUMNS = {'timestamp_unix', 'timestamp', 'RR', 'force'}
+CARDIAC_COLUMNS = {'timestamp_unix', 'timestamp', 'HR', 'HRV'}
+
+# Traces in the PPG signal figure are thinned to at most this many vertices
+HRV_SIGNAL_MAX_POINTS = 4000
+
+# generate_hrv_plot figure layout per plot type:
+# (size in inches, suptitle, tick label size, filename, display name).
+# The domain summaries are few artists and save faster as SVG, skipping
+# rasterization; the dense PPG trace stays PNG.
+HRV_PLOT_SPECS = {
+    'signal': ((20, 22), 'PPG Signal with Detected Peaks', 12, 'HRV_ppg_signal.png', 'HRV - PPG Signal with Peaks'),
+    'time': ((20, 20), 'Time Domain HRV', 18, 'HRV_time_domain.svg', 'HRV - Time Domain'),
+    'frequency': ((20, 18), 'Frequency Domain HRV', 18, 'HRV_frequency_domain.svg', 'HRV - Frequency Domain'),
+    'nonlinear': ((22, 20), 'Non-linear HRV', 18, 'HRV_nonlinear.svg', 'HRV - Non-linear')
+}
+
+# Metric plots are rendered on a small thread pool so PNG encoding overlaps
+# with loading and windowing the next metric. Futures are resolved when
+# run_analysis finalizes its results. ANALYSIS_PLOT_THREADS=0 renders inline.
+_PLOT_THREADS = int(os.environ.get('ANALYSIS_PLOT_THREADS', 2))
+_plot_pool = ThreadPoolExecutor(max_workers=_PLOT_THREADS, thread_name_prefix='plot') if _PLOT_THREADS > 0 else None
+
+# BiometricDataCleaner instances by metric type, see _get_cleaner()
+_cleaners = {}
+
+
+def _neurokit():
+    """
+    Import neurokit2 on first use. It pulls in scipy.signal, sklearn and more,
+    which is only worth paying for when HRV is actually analyzed.
+    """
+    import neurokit2 as nk
+    return nk
+
+
+def _plot_generator():
+    """
+    Import plot_generator (and matplotlib.figure behind it) on first use,
+    so statistics-only runs with plots_enabled=False never load it.
+    """
+    import plot_generator
+    return plot_generator
+
+
+def _get_cleaner(metric_type):
+    """
+    Shared BiometricDataCleaner per metric type. A cleaner only holds its
+    thresholds, so one instance serves every subject and metric file.
+    DataCleaner (and the scipy.signal it imports) is loaded on first use.
+    """
+    cleaner = _cleaners.get(metric_type)
+    if cleaner is None:
+        from DataCleaner import BiometricDataCleaner
+        cleaner = BiometricDataCleaner(metric_type=metric_type)
+        _cleaners[metric_type] = cleaner
+    return cleaner
+
+
+def _submit_plot(plot_fn, *args, **kwargs):
+    """
+    Queue a plot_generator call on the plot pool. Returns a Future, or the
+    plot dict itself when rendering inline.
+    """
+    if _plot_pool is None:
+        return plot_fn(*args, **kwargs)
+    return _plot_pool.submit(plot_fn, *args, **kwargs)
+
+
+def _resolve_plots(plots, errors=None):
+    """
+    Wait for queued plots and return the plot dicts that were produced.
+    Rendering errors are logged and appended to errors, if given.
+    """
+    resolved = []
+    for plot in plots:
+        if isinstance(plot, Future):
+            try:
+                plot = plot.result()
+            except Exception as e:
+                error_msg = f"Error generating plot: {str(e)}"
+                logger.exception(error_msg)
+                if errors is not None:
+                    errors.append(error_msg)
+                continue
+        if plot:
+            resolved.append(plot)
+    return resolved
+
+
+# Worker processes start from a fork server rather than a fork of this
+# process: the Flask server is multi-threaded and a plain fork can inherit
+# locks held by other threads. Windows has no fork server, so spawn is used.
+_MP_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
 )
+if _MP_CONTEXT.get_start_method() == 'forkserver':
+    # Workers fork from a server that has already imported this module
+    _MP_CONTEXT.set_forkserver_preload([__name__])
+
+
+def _init_worker_process(log_level=logging.INFO):
+    """
+    Process-pool initializer. Workers render plots inline instead of on the
+    plot thread pool, and draw their HRV figures inline instead of nesting
+    another process pool. Logging is configured like the parent's, which a
+    fresh worker process does not inherit.
+    """
+    global _plot_pool
+    _plot_pool = None
+    os.environ['ANALYSIS_WORKERS'] = '1'
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=log_level, format='%(message)s')
+
+
+def _process_pool(workers):
+    """ProcessPoolExecutor for per-subject analysis and HRV figures."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_MP_CONTEXT,
+        initializer=_init_worker_process,
+        initargs=(logging.getLogger().getEffectiveLevel(),)
+    )
+
+
+# Metric tag at the end of an EmotiBit filename, e.g. '..._HR.csv' -> 'HR'
+_METRIC_FILE_PATTERN = re.compile(r'_([A-Za-z0-9%]+)\.csv$')
+
+# Event markers are invariant across metrics, so parsed frames and offsets are
+# memoized per file. Entries are keyed by path and revalidated against the
+# file's mtime, so a re-uploaded file is parsed again.
+_event_markers_cache = {}
+_offset_cache = {}
+
+# Parsed metric CSVs, keyed by path and revalidated against (mtime, size).
+# The same file is read by the validation step, analyze_metric and HRV.
+_metric_csv_cache = {}
+
+# Polar H10 cardiac frames with LocalTimestamp derived, keyed and revalidated
+# like _metric_csv_cache, so reruns on unchanged files skip the ISO parse.
+_cardiac_csv_cache = {}
+
+
+def _load_metric_cached(metric_file):
+    """
+    read_metric_csv() memoized for the lifetime of the process while the file
+    is unchanged. The returned DataFrame is shared - do not modify it.
+    """
+    stat = os.stat(metric_file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _metric_csv_cache.get(metric_file)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    df_metric = read_metric_csv(metric_file)
+    _metric_csv_cache[metric_file] = (signature, df_metric)
+    return df_metric
+
+
+def _load_cardiac_cached(cardiac_file):
+    """
+    Read a cardiac CSV and derive its LocalTimestamp column, reusing the
+    frame while the file is unchanged. Returns None if the file has no
+    timestamp column. The returned DataFrame is shared - do not modify it.
+    """
+    stat = os.stat(cardiac_file)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _cardiac_csv_cache.get(cardiac_file)
+    if cached is not None and cached[0] == signature:
+        logger.debug(f"Reused parsed {os.path.basename(cardiac_file)}")
+        return cached[1]
+    
+    # Only the timestamp and metric columns are parsed
+    df_cardiac = pd.read_csv(cardiac_file, usecols=lambda col: col in CARDIAC_COLUMNS)
+    
+    # Cardiac files already have timestamp_unix column
+    if 'timestamp_unix' in df_cardiac.columns:
+        df_cardiac['LocalTimestamp'] = df_cardiac['timestamp_unix']
+    elif 'timestamp' in df_cardiac.columns:
+        # Fallback: parse ISO timestamp
+        df_cardiac['LocalTimestamp'] = _to_unix_seconds(df_cardiac['timestamp'])
+    else:
+        df_cardiac = None
+    
+    _cardiac_csv_cache[cardiac_file] = (signature, df_cardiac)
+    return df_cardiac
+
+
+def _load_event_markers(event_markers_path):
+    """
+    Read and prepare an event markers CSV, reusing the parsed frame while
+    the file is unchanged. The returned DataFrame is shared - do not modify it.
+    """
+    mtime = os.path.getmtime(event_markers_path)
+    cached = _event_markers_cache.get(event_markers_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    df_markers = prepare_event_markers_timestamps(pd.read_csv(event_markers_path))
+    _event_markers_cache[event_markers_path] = (mtime, df_markers)
+    return df_markers
+
+
+def _cached_timestamp_offset(event_markers_path, metric_file, df_markers, df_metric):
+    """
+    find_timestamp_offset() memoized on the (event markers, metric file) pair.
+    Only valid for uncleaned metric data - cleaning can drop the first samples.
+    """
+    key = (event_markers_path, metric_file)
+    mtimes = (os.path.getmtime(event_markers_path), os.path.getmtime(metric_file))
+    cached = _offset_cache.get(key)
+    if cached is not None and cached[0] == mtimes:
+        return cached[1]
+    
+    offset = find_timestamp_offset(df_markers, df_metric)
+    _offset_cache[key] = (mtimes, offset)
+    return offset
+
+
+def _to_unix_seconds(timestamps):
+    """
+    Unix seconds from a timestamp column. Numeric columns are already Unix
+    seconds and are returned as-is; ISO strings are parsed in one vectorized
+    pass, with naive times taken as UTC as pd.Timestamp.timestamp() does.
+    """
+    if pd.api.types.is_numeric_dtype(timestamps):
+        return timestamps
+    return (pd.to_datetime(timestamps, utc=True) - pd.Timestamp(0, tz='UTC')).dt.total_seconds()
+
+
+def _prune_caches(manifest):
+    """
+    Drop cached frames for files that are not part of this manifest, so a
+    long-running server only keeps the current dataset in memory. Entries
+    for files in the manifest survive, so reruns on the same data reuse them.
+    """
+    paths = {f['path'] for f in manifest.get('emotibit_files', [])}
+    if manifest.get('event_markers'):
+        paths.add(manifest['event_markers']['path'])
+    paths.update(em['path'] for em in manifest.get('event_markers_by_subject', {}).values() if em)
+    paths.update(f['path'] for f in manifest.get('cardiac_files', []))
+    
+    for cache in (_metric_csv_cache, _event_markers_cache, _cardiac_csv_cache):
+        for path in [path for path in cache if path not in paths]:
+            del cache[path]
+    for key in [key for key in _offset_cache if not set(key) <= paths]:
+        del _offset_cache[key]
 
 
 def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups, 
                  analysis_method='raw', plot_type='lineplot', analyze_hrv=False, 
                  output_folder='data/outputs', batch_mode=False, selected_subjects=None,
                  external_configs=None, respiratory_configs=None, cardiac_configs=None,
-                 analysis_type='inter', cleaning_enabled=False, cleaning_stages=None):
+                 analysis_type='inter', cleaning_enabled=False, cleaning_stages=None,
+                 plots_enabled=True):
     """
     Main entry point for analysis.
     
@@ -47,11 +318,13 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
         output_folder: Where to save plots
         batch_mode: Whether analyzing multiple subjects
         selected_subjects: List of subject names (if batch_mode)
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         results: Dict containing analysis results, plots, and status
     """
     os.makedirs(output_folder, exist_ok=True)
+    _prune_caches(manifest)
     results = {
         'status': 'processing',
         'timestamp': datetime.now().isoformat(),
@@ -71,61 +344,61 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
         }
     }
     
-    print("\n" + "="*80)
-    print("STARTING ANALYSIS")
-    print("="*80)
-    print(f"Subject folder: {os.path.basename(upload_folder)}")
-    print(f"EmotiBit files: {len(manifest.get('emotibit_files', []))}")
+    logger.info("\n" + "="*80)
+    logger.info("STARTING ANALYSIS")
+    logger.info("="*80)
+    logger.info(f"Subject folder: {os.path.basename(upload_folder)}")
+    logger.info(f"EmotiBit files: {len(manifest.get('emotibit_files', []))}")
     
     if batch_mode:
         em_count = len(manifest.get('event_markers_by_subject', {}))
-        print(f"Event markers: {em_count} subjects")
+        logger.info(f"Event markers: {em_count} subjects")
     else:
-        print(f"Event markers: {'Yes' if manifest.get('event_markers') else 'No'}")
-    
-    print(f"External files: {len(manifest.get('external_files', []))}")
-    print(f"Selected metrics: {selected_metrics}")
-    print(f"Comparison groups: {len(comparison_groups)}")
-    print(f"Analysis method: {analysis_method}")
-    print(f"Plot type: {plot_type}")
-    print(f"Batch mode: {batch_mode}")
+        logger.info(f"Event markers: {'Yes' if manifest.get('event_markers') else 'No'}")
+    
+    logger.info(f"External files: {len(manifest.get('external_files', []))}")
+    logger.info(f"Selected metrics: {selected_metrics}")
+    logger.info(f"Comparison groups: {len(comparison_groups)}")
+    logger.info(f"Analysis method: {analysis_method}")
+    logger.info(f"Plot type: {plot_type}")
+    logger.info(f"Batch mode: {batch_mode}")
 
     if batch_mode and selected_subjects:
-        print(f"Selected subjects: {selected_subjects}")
+        logger.info(f"Selected subjects: {selected_subjects}")
 
-    print("="*80 + "\n")
+    logger.info("="*80 + "\n")
     
     if len(comparison_groups) < 1:
         results['warnings'].append('Need at least 1 comparison group')
-        print("Warning: Need at least 1 comparison group\n")
+        logger.warning("Need at least 1 comparison group\n")
     
-    print("1. LOADING EVENT MARKERS")
-    print("-" * 80)
+    logger.info("1. LOADING EVENT MARKERS")
+    logger.info("-" * 80)
 
     df_markers = None
 
     try:
         if batch_mode:
-            print(f"Batch mode: Event markers will be loaded per-subject")
+            logger.info(f"Batch mode: Event markers will be loaded per-subject")
             em_count = len(manifest.get('event_markers_by_subject', {}))
-            print(f"{em_count} subject(s) have event markers")
+            logger.info(f"{em_count} subject(s) have event markers")
             
             df_markers = True  # Truthy value to pass checks
             
         elif manifest.get('event_markers'):
             event_markers_path = manifest['event_markers']['path']
-            print(f"Loading from: {event_markers_path}")
+            logger.info(f"Loading from: {event_markers_path}")
             
-            df_markers = pd.read_csv(event_markers_path)
-            print(f"Loaded {df_markers.shape[0]} rows")
-            print(f"Columns: {df_markers.columns.tolist()}")
-            
-            df_markers = prepare_event_markers_timestamps(df_markers)
+            # Shared with the metric loop through the event markers cache
+            df_markers = _load_event_markers(event_markers_path)
+            logger.info(f"Loaded {df_markers.shape[0]} rows")
+            logger.info(f"Columns: {df_markers.columns.tolist()}")
             
+            markers_head = df_markers.head(10)
             results['markers'] = {
                 'shape': df_markers.shape,
                 'columns': list(df_markers.columns),
-                'head': df_markers.head(10).replace({np.nan: None}).to_dict('records')
+                'head': markers_head.astype(object).where(markers_head.notna(), None).to_dict('records')
             }
             
             if 'condition' in df_markers.columns:
@@ -135,51 +408,63 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
             
     except Exception as e:
         error_msg = f"Error loading event markers: {str(e)}"
-        print(f"ERROR: {error_msg}")
+        logger.error(error_msg)
         results['errors'].append(error_msg)
         df_markers = None
 
-    print()
     
     if analyze_hrv and df_markers is not None:
-        if batch_mode and analysis_type == 'intra' and len(selected_subjects) > 1:
-            print("2. SKIPPING HRV ANALYSIS")
-            print("-" * 80)
-            print("HRV analysis is disabled for intra-subject (multi-subject comparison) mode")
-            print("Reason: HRV processing takes 30-75 seconds per subject and would cause timeouts")
-            print("Recommendation: Use inter-subject mode to analyze each subject's HRV separately")
-            results['warnings'].append('HRV skipped: Not supported in intra-subject mode (use inter-subject instead)')
-            print()
-        else:
-            print("2. ANALYZING HRV")
-            print("-" * 80)
-        
-        try:
-            hrv_results, hrv_plots = analyze_hrv_from_ppg(
-                manifest, 
-                df_markers, 
-                comparison_groups, 
-                output_folder
+        if batch_mode and selected_subjects:
+            # Each subject's PPG is processed in its own worker process, so
+            # the batch takes about as long as its slowest subject
+            logger.info(f"2. ANALYZING HRV ({len(selected_subjects)} subjects)")
+            logger.info("-" * 80)
+            
+            hrv_outputs = _map_subjects(
+                _hrv_one_subject,
+                selected_subjects,
+                manifest,
+                output_folder,
+                plots_enabled=plots_enabled
             )
             
-            if hrv_results:
-                results['hrv'] = hrv_results
+            results['hrv_by_subject'] = {}
+            for subject, hrv_results, hrv_plots, error_msg in hrv_outputs:
+                if error_msg:
+                    error_msg = f"Error analyzing HRV for {subject}: {error_msg}"
+                    logger.error(error_msg)
+                    results['errors'].append(error_msg)
+                    continue
+                
+                results['hrv_by_subject'][subject] = hrv_results
                 results['plots'].extend(hrv_plots)
-            print()
-        except Exception as e:
-            error_msg = f"Error analyzing HRV: {str(e)}"
-            print(f"ERROR: {error_msg}")
-            results['errors'].append(error_msg)
-            import traceback
-            traceback.print_exc()
-            print()
+        else:
+            logger.info("2. ANALYZING HRV")
+            logger.info("-" * 80)
+        
+            try:
+                hrv_results, hrv_plots = analyze_hrv_from_ppg(
+                    manifest, 
+                    df_markers, 
+                    comparison_groups, 
+                    output_folder,
+                    plots_enabled=plots_enabled
+                )
+                
+                if hrv_results:
+                    results['hrv'] = hrv_results
+                    results['plots'].extend(hrv_plots)
+            except Exception as e:
+                error_msg = f"Error analyzing HRV: {str(e)}"
+                logger.exception(error_msg)
+                results['errors'].append(error_msg)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ANALYZE EXTERNAL DATA FILES
     # ═══════════════════════════════════════════════════════════════════════════
     if external_configs and len(external_configs) > 0:
-        print(f"3a. ANALYZING EXTERNAL DATA")
-        print("-" * 80)
+        logger.info(f"3a. ANALYZING EXTERNAL DATA")
+        logger.info("-" * 80)
         
         try:
             external_results, external_plots = analyze_external_data(
@@ -192,7 +477,8 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                 analysis_method=analysis_method,
                 plot_type=plot_type,
                 cleaning_enabled=cleaning_enabled,
-                cleaning_stages=cleaning_stages
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
             )
             
             if external_results:
@@ -202,23 +488,19 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                     results['analysis'][f"External: {data_label}"] = stats
                 
                 results['plots'].extend(external_plots)
-                print(f"  ✓ Analyzed {len(external_results)} external data series")
+                logger.info(f"  ✓ Analyzed {len(external_results)} external data series")
             
-            print()
         except Exception as e:
             error_msg = f"Error analyzing external data: {str(e)}"
-            print(f"ERROR: {error_msg}")
+            logger.exception(error_msg)
             results['errors'].append(error_msg)
-            import traceback
-            traceback.print_exc()
-            print()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ANALYZE RESPIRATORY DATA FILES
     # ═══════════════════════════════════════════════════════════════════════════
     if respiratory_configs and len(respiratory_configs) > 0:
-        print(f"3b. ANALYZING RESPIRATORY DATA")
-        print("-" * 80)
+        logger.info(f"3b. ANALYZING RESPIRATORY DATA")
+        logger.info("-" * 80)
         
         try:
             respiratory_results, respiratory_plots = analyze_respiratory_data(
@@ -231,7 +513,8 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                 analysis_method=analysis_method,
                 plot_type=plot_type,
                 cleaning_enabled=cleaning_enabled,
-                cleaning_stages=cleaning_stages
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
             )
             
             if respiratory_results:
@@ -240,23 +523,19 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                     results['analysis'][f"Respiratory: {metric_label}"] = stats
                 
                 results['plots'].extend(respiratory_plots)
-                print(f"  ✓ Analyzed {len(respiratory_results)} respiratory metrics")
+                logger.info(f"  ✓ Analyzed {len(respiratory_results)} respiratory metrics")
             
-            print()
         except Exception as e:
             error_msg = f"Error analyzing respiratory data: {str(e)}"
-            print(f"ERROR: {error_msg}")
+            logger.exception(error_msg)
             results['errors'].append(error_msg)
-            import traceback
-            traceback.print_exc()
-            print()
 
     # ═══════════════════════════════════════════════════════════════════════════
     # ANALYZE CARDIAC DATA FILES
     # ═══════════════════════════════════════════════════════════════════════════
     if cardiac_configs and len(cardiac_configs) > 0:
-        print(f"3c. ANALYZING CARDIAC DATA")
-        print("-" * 80)
+        logger.info(f"3c. ANALYZING CARDIAC DATA")
+        logger.info("-" * 80)
         
         try:
             cardiac_results, cardiac_plots = analyze_cardiac_data(
@@ -269,7 +548,8 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                 analysis_method=analysis_method,
                 plot_type=plot_type,
                 cleaning_enabled=cleaning_enabled,
-                cleaning_stages=cleaning_stages
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
             )
             
             if cardiac_results:
@@ -278,35 +558,47 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                     results['analysis'][f"Cardiac: {metric_label}"] = stats
                 
                 results['plots'].extend(cardiac_plots)
-                print(f"  ✓ Analyzed {len(cardiac_results)} cardiac metrics")
+                logger.info(f"  ✓ Analyzed {len(cardiac_results)} cardiac metrics")
             
-            print()
         except Exception as e:
             error_msg = f"Error analyzing cardiac data: {str(e)}"
-            print(f"ERROR: {error_msg}")
+            logger.exception(error_msg)
             results['errors'].append(error_msg)
-            import traceback
-            traceback.print_exc()
-            print()
 
     # Analyze selected metrics
     if df_markers is not None and selected_metrics:
-        print(f"4. ANALYZING SELECTED METRICS (Method: {get_method_label(analysis_method)})")
-        print("-" * 80)
+        logger.info(f"4. ANALYZING SELECTED METRICS (Method: {get_method_label(analysis_method)})")
+        logger.info("-" * 80)
         
         # Synchronize HRV flag with selected metrics
         if 'HRV' in selected_metrics and not analyze_hrv:
-            print("HRV detected in metrics list - enabling HRV analysis")
+            logger.info("HRV detected in metrics list - enabling HRV analysis")
             analyze_hrv = True
         
+        # One pass over the manifest instead of a scan per metric
+        files_by_metric = _index_files_by_metric(manifest.get('emotibit_files', []))
+        
+        # Subject -> files mapping does not change between metrics
+        subject_files_by_subject = None
+        if batch_mode and selected_subjects:
+            subject_files_by_subject = {
+                subject: get_subject_files(manifest, subject) for subject in selected_subjects
+            }
+        
+        # Inter-subject results are also appended here one subject at a time,
+        # so a long batch leaves usable output behind if it fails part way
+        partial_results_path = os.path.join(output_folder, 'partial_results.jsonl')
+        if batch_mode and selected_subjects and analysis_type != 'intra':
+            open(partial_results_path, 'w').close()
+        
         for metric in selected_metrics:
             if metric == 'HRV':
                 # HRV is handled separately above
-                print(f"\nSkipping HRV (handled in dedicated HRV analysis section)")
+                logger.info(f"\nSkipping HRV (handled in dedicated HRV analysis section)")
                 continue
                 
-            print(f"\nAnalyzing metric: {metric}")
-            print("-" * 40)
+            logger.info(f"\nAnalyzing metric: {metric}")
+            logger.info("-" * 40)
             
             try:
                 # ═══════════════════════════════════════════════════════════
@@ -316,7 +608,7 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                     
                     # INTRA-SUBJECT: Compare subjects together
                     if analysis_type == 'intra':
-                        print(f"Intra-subject comparison: {len(selected_subjects)} subjects")
+                        logger.info(f"Intra-subject comparison: {len(selected_subjects)} subjects")
                         
                         metric_results, metric_plots = analyze_metric_multi_subject(
                             manifest,
@@ -327,7 +619,9 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                             plot_type,
                             output_folder,
                             cleaning_enabled=cleaning_enabled,
-                            cleaning_stages=cleaning_stages
+                            cleaning_stages=cleaning_stages,
+                            subject_files_by_subject=subject_files_by_subject,
+                            plots_enabled=plots_enabled
                         )
                         
                         if metric_results:
@@ -336,126 +630,97 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                     
                     # INTER-SUBJECT: Analyze each subject separately
                     else:
-                        print(f"Inter-subject analysis: {len(selected_subjects)} subjects")
-                        print(f"Running single-subject analysis for each subject...\n")
+                        logger.info(f"Inter-subject analysis: {len(selected_subjects)} subjects")
+                        logger.info(f"Running single-subject analysis for each subject...\n")
                         
-                        for subject in selected_subjects:
-                            print(f"  {'='*60}")
-                            print(f"  Subject: {subject}")
-                            print(f"  {'='*60}")
-                            
-                            subject_files = get_subject_files(manifest, subject)
-                            
-                            if not subject_files['event_markers']:
-                                print(f"No event markers - skipping")
-                                continue
-                            
-                            em_path = subject_files['event_markers']['path']
-                            print(f"Loading event markers: {os.path.basename(em_path)}")
-                            df_subject_markers = pd.read_csv(em_path)
-                            df_subject_markers = prepare_event_markers_timestamps(df_subject_markers)
-                            
-                            metric_file = find_metric_file_for_subject(subject_files, metric)
-                            if not metric_file:
-                                print(f"No {metric} file found - skipping")
-                                continue
-                            
-                            # Run single-subject analysis
-                            try:
-                                subject_short = subject[:30]  # First 30 chars to keep filename reasonable
-
-                                metric_results, metric_plots = analyze_metric(
-                                    metric_file,
-                                    df_subject_markers,
-                                    comparison_groups,
-                                    metric,
-                                    analysis_method,
-                                    plot_type,
-                                    output_folder,
-                                    subject_suffix=f"_{subject_short}",
-                                    subject_label=subject,
-                                    cleaning_enabled=cleaning_enabled,
-                                    cleaning_stages=cleaning_stages
-                                )
-                                                                
+                        subject_frames = _load_subject_frames(
+                            manifest, selected_subjects, metric, cleaning_enabled, subject_files_by_subject
+                        )
+                        subject_outputs = _map_subjects(
+                            _analyze_one_subject,
+                            selected_subjects,
+                            manifest,
+                            comparison_groups,
+                            metric,
+                            analysis_method,
+                            plot_type,
+                            output_folder,
+                            subject_kwargs=subject_frames,
+                            cleaning_enabled=cleaning_enabled,
+                            cleaning_stages=cleaning_stages,
+                            subject_files_by_subject=subject_files_by_subject,
+                            plots_enabled=plots_enabled
+                        )
+                        
+                        with open(partial_results_path, 'a') as partial_file:
+                            for subject, metric_results, metric_plots in subject_outputs:
                                 if metric_results:
-                                    if metric not in results['analysis']:
-                                        results['analysis'][metric] = {}
-                                    
-                                    for group_label, stats in metric_results.items():
-                                        composite_key = f"{subject} - {group_label}"
-                                        results['analysis'][metric][composite_key] = stats
+                                    results['analysis'].setdefault(metric, {}).update(
+                                        {f"{subject} - {group_label}": stats for group_label, stats in metric_results.items()}
+                                    )
                                     
+                                    # Wait for this subject's queued plots so the record lists them
+                                    metric_plots = _resolve_plots(metric_plots, results['errors'])
                                     results['plots'].extend(metric_plots)
                                     
-                            except Exception as e:
-                                print(f"Error analyzing subject: {e}")
-                                continue
-                            
-                            print()  
+                                    json.dump({
+                                        'metric': metric,
+                                        'subject': subject,
+                                        'stats': metric_results,
+                                        'plots': [plot['filename'] for plot in metric_plots]
+                                    }, partial_file, default=str)
+                                    partial_file.write('\n')
+                                    partial_file.flush()
                 
                 # ═══════════════════════════════════════════════════════════
                 # SINGLE SUBJECT MODE (ORIGINAL LOGIC)
                 # ═══════════════════════════════════════════════════════════
                 else:
-                    print(f"Single subject analysis")
+                    logger.info(f"Single subject analysis")
+                    
+                    candidates = files_by_metric.get(metric, [])
+                    metric_file = None
                     
                     event_markers_file = manifest.get('event_markers')
                     if event_markers_file:
                         em_path_parts = event_markers_file.get('path', '').split('/')
                         subject_from_em = em_path_parts[-2] if len(em_path_parts) >= 2 else None
-                        print(f"Subject from event markers: {subject_from_em}")
-                        
-                        print(f"\n  Available EmotiBit files:")
-                        for idx, eb_file in enumerate(manifest['emotibit_files']):
-                            print(f"[{idx}] {eb_file.get('filename', 'NO_FILENAME')}")
-                            print(f"Path: {eb_file.get('path', 'NO_PATH')}")
-                            print(f"Subject field: {eb_file.get('subject', 'NO_SUBJECT_FIELD')}")
-                        print()
-                        
-                        metric_file = None
-                        for emotibit_file in manifest['emotibit_files']:
-                            if f'_{metric}.csv' in emotibit_file['filename']:
-                                file_path = emotibit_file.get('path', '')
-                                file_subject = emotibit_file.get('subject', '')
-                                
-                                print(f"  Checking file: {os.path.basename(emotibit_file['filename'])}")
-                                print(f"- File subject field: {file_subject}")
-                                print(f"- Subject in path: {subject_from_em in file_path if subject_from_em else False}")
-                                print(f"- Subject field match: {file_subject == subject_from_em}")
-                                
-                                if subject_from_em and (file_subject == subject_from_em or subject_from_em in file_path):
-                                    metric_file = emotibit_file['path']
-                                    print(f"Matched metric file to subject: {os.path.basename(metric_file)}")
-                                    break
+                        logger.info(f"Subject from event markers: {subject_from_em}")
+                        logger.info(f"{len(candidates)} {metric} file(s) in manifest")
                         
-                        if not metric_file:
-                            print(f"WARNING: Could not match subject, using first {metric} file found")
-                            for emotibit_file in manifest['emotibit_files']:
-                                if f'_{metric}.csv' in emotibit_file['filename']:
-                                    metric_file = emotibit_file['path']
-                                    break
-                    else:
-                        for emotibit_file in manifest['emotibit_files']:
-                            if f'_{metric}.csv' in emotibit_file['filename']:
+                        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                        for emotibit_file in candidates:
+                            file_path = emotibit_file.get('path', '')
+                            file_subject = emotibit_file.get('subject', '')
+                            if debug_enabled:
+                                logger.debug(f"  Checking file: {emotibit_file['filename']} (subject field: {file_subject})")
+                            
+                            if subject_from_em and (file_subject == subject_from_em or subject_from_em in file_path):
                                 metric_file = emotibit_file['path']
+                                logger.info(f"Matched metric file to subject: {os.path.basename(metric_file)}")
                                 break
+                        
+                        if not metric_file:
+                            logger.warning(f"Could not match subject, using first {metric} file found")
+                    
+                    if not metric_file and candidates:
+                        metric_file = candidates[0]['path']
                                     
                     if not metric_file:
-                        print(f"Warning: File for metric {metric} not found - skipping")
+                        logger.warning(f"File for metric {metric} not found - skipping")
                         continue
                     
                     try:
-                        test_df = pd.read_csv(metric_file)
+                        test_df = _load_metric_cached(metric_file)
                         actual_metric_col = test_df.columns[-1]
-                        print(f"Verified metric column: '{actual_metric_col}'")
+                        logger.info(f"Verified metric column: '{actual_metric_col}'")
                         
                         if test_df.shape[0] == 0:
-                            print(f"Warning: Metric file is empty - skipping")
+                            logger.warning(f"Metric file is empty - skipping")
                             continue
                             
                     except Exception as e:
-                        print(f"Error validating metric file: {e}")
+                        logger.error(f"Error validating metric file: {e}")
                         continue
                     
                     # Use original single-subject logic
@@ -468,7 +733,9 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                         plot_type,
                         output_folder,
                         cleaning_enabled=cleaning_enabled,
-                        cleaning_stages=cleaning_stages
+                        cleaning_stages=cleaning_stages,
+                        plots_enabled=plots_enabled,
+                        event_markers_path=manifest['event_markers']['path']
                     )
                     
                     if metric_results:
@@ -477,39 +744,203 @@ def run_analysis(upload_folder, manifest, selected_metrics, comparison_groups,
                 
             except Exception as e:
                 error_msg = f"Error analyzing {metric}: {str(e)}"
-                print(f"ERROR: {error_msg}")
+                logger.exception(error_msg)
                 results['errors'].append(error_msg)
-                import traceback
-                traceback.print_exc()
         
-        print()
     else:
-        print("Skipping analysis - no event markers or metrics selected\n")
+        logger.info("Skipping analysis - no event markers or metrics selected\n")
+    
+    logger.info("5. FINALIZING RESULTS")
+    logger.info("-" * 80)
     
-    print("5. FINALIZING RESULTS")
-    print("-" * 80)
+    results['plots'] = _resolve_plots(results['plots'], results['errors'])
     
     results['status'] = 'completed' if len(results['errors']) == 0 else 'completed_with_errors'
     
-    print(f"Analysis complete!")
-    print(f". Status: {results['status']}")
-    print(f"Plots generated: {len(results['plots'])}")
-    print(f"Metrics analyzed: {len(results.get('analysis', {}))}")
+    logger.info(f"Analysis complete!")
+    logger.info(f". Status: {results['status']}")
+    logger.info(f"Plots generated: {len(results['plots'])}")
+    logger.info(f"Metrics analyzed: {len(results.get('analysis', {}))}")
     if results['errors']:
-        print(f"Errors: {len(results['errors'])}")
+        logger.info(f"Errors: {len(results['errors'])}")
     if results['warnings']:
-        print(f"Warnings: {len(results['warnings'])}")
+        logger.info(f"Warnings: {len(results['warnings'])}")
     
-    print("\n" + "="*80)
-    print("ANALYSIS COMPLETE")
-    print("="*80 + "\n")
+    logger.info("\n" + "="*80)
+    logger.info("ANALYSIS COMPLETE")
+    logger.info("="*80 + "\n")
     
     return results
 
 
+def _index_files_by_metric(emotibit_files):
+    """
+    Group EmotiBit file entries by the metric tag at the end of the filename
+    (e.g. '..._HR.csv' -> 'HR'), preserving manifest order within each tag.
+    """
+    files_by_metric = {}
+    for emotibit_file in emotibit_files:
+        match = _METRIC_FILE_PATTERN.search(emotibit_file['filename'])
+        if match:
+            files_by_metric.setdefault(match.group(1), []).append(emotibit_file)
+    return files_by_metric
+
+
+def _analysis_workers(n_tasks):
+    """
+    Number of worker processes for per-subject analysis.
+    Set ANALYSIS_WORKERS to override the default (CPU count).
+    """
+    workers = int(os.environ.get('ANALYSIS_WORKERS', 0)) or os.cpu_count() or 1
+    return max(1, min(workers, n_tasks))
+
+
+def _map_subjects(worker, subjects, *args, subject_kwargs=None, **kwargs):
+    """
+    Run worker(subject, *args, **kwargs) for every subject, in a process pool
+    when there is more than one subject. Results keep the order of subjects.
+    subject_kwargs optionally maps a subject to extra keyword arguments that
+    are passed to that subject's call only.
+    """
+    subjects = list(subjects)
+    subject_kwargs = subject_kwargs or {}
+    workers = _analysis_workers(len(subjects))
+    
+    if workers <= 1:
+        return [worker(subject, *args, **kwargs, **subject_kwargs.get(subject, {})) for subject in subjects]
+    
+    logger.info(f"Dispatching {len(subjects)} subjects to {workers} worker processes")
+    with _process_pool(workers) as executor:
+        futures = [
+            executor.submit(worker, subject, *args, **kwargs, **subject_kwargs.get(subject, {}))
+            for subject in subjects
+        ]
+        return [future.result() for future in futures]
+
+
+def _render_hrv_plots(tasks, output_folder, suffix='', subject_label=''):
+    """
+    Run generate_hrv_plot(data, param, plot_type, output_folder, ...) for every
+    (data, param, plot_type) task, in a process pool since NeuroKit draws
+    through pyplot's global state. Results keep the order of tasks.
+    """
+    workers = _analysis_workers(len(tasks))
+    
+    if workers <= 1:
+        return [generate_hrv_plot(*task, output_folder, suffix, subject_label) for task in tasks]
+    
+    with _process_pool(workers) as executor:
+        futures = [
+            executor.submit(generate_hrv_plot, *task, output_folder, suffix, subject_label)
+            for task in tasks
+        ]
+        return [future.result() for future in futures]
+
+
+def _load_subject_frames(manifest, subjects, metric, cleaning_enabled=False,
+                         subject_files_by_subject=None):
+    """
+    Load each subject's event markers and metric frame in the parent process,
+    along with the timestamp offset when the data is not cleaned, so the
+    caches outlive the worker processes and reruns on unchanged files reuse
+    them. Returns subject -> keyword arguments for _analyze_one_subject().
+    A metric file that fails to load is left to the worker, which reports it.
+    """
+    subject_frames = {}
+    for subject in subjects:
+        if subject_files_by_subject and subject in subject_files_by_subject:
+            subject_files = subject_files_by_subject[subject]
+        else:
+            subject_files = get_subject_files(manifest, subject)
+        
+        if not subject_files['event_markers']:
+            continue
+        
+        em_path = subject_files['event_markers']['path']
+        frames = {'df_markers': _load_event_markers(em_path)}
+        metric_file = find_metric_file_for_subject(subject_files, metric)
+        if metric_file:
+            try:
+                frames['df_metric'] = _load_metric_cached(metric_file)
+                if not cleaning_enabled:
+                    frames['offset'] = _cached_timestamp_offset(
+                        em_path, metric_file, frames['df_markers'], frames['df_metric']
+                    )
+            except Exception:
+                pass
+        subject_frames[subject] = frames
+    
+    return subject_frames
+
+
+def _analyze_one_subject(subject, manifest, comparison_groups, metric, analysis_method,
+                         plot_type, output_folder, cleaning_enabled=False, cleaning_stages=None,
+                         subject_files_by_subject=None, plots_enabled=True,
+                         df_markers=None, df_metric=None, offset=None):
+    """
+    Inter-subject worker: run the single-subject analysis of one metric for
+    one subject. Kept at module level so it can run in a worker process.
+    df_markers, df_metric and offset, when given, were already computed by
+    the parent (see _load_subject_frames()).
+    
+    Returns:
+        Tuple of (subject, metric_results dict or None, plots list)
+    """
+    logger.info(f"  {'='*60}")
+    logger.info(f"  Subject: {subject}")
+    logger.info(f"  {'='*60}")
+    
+    if subject_files_by_subject and subject in subject_files_by_subject:
+        subject_files = subject_files_by_subject[subject]
+    else:
+        subject_files = get_subject_files(manifest, subject)
+    
+    if not subject_files['event_markers']:
+        logger.info(f"No event markers - skipping")
+        return subject, None, []
+    
+    em_path = subject_files['event_markers']['path']
+    if df_markers is None:
+        logger.info(f"Loading event markers: {os.path.basename(em_path)}")
+        df_markers = _load_event_markers(em_path)
+    
+    metric_file = find_metric_file_for_subject(subject_files, metric)
+    if not metric_file:
+        logger.info(f"No {metric} file found - skipping")
+        return subject, None, []
+    
+    # Run single-subject analysis
+    try:
+        subject_short = subject[:30]  # First 30 chars to keep filename reasonable
+        
+        metric_results, metric_plots = analyze_metric(
+            metric_file,
+            df_markers,
+            comparison_groups,
+            metric,
+            analysis_method,
+            plot_type,
+            output_folder,
+            subject_suffix=f"_{subject_short}",
+            subject_label=subject,
+            cleaning_enabled=cleaning_enabled,
+            cleaning_stages=cleaning_stages,
+            plots_enabled=plots_enabled,
+            df_metric=df_metric,
+            offset=offset,
+            event_markers_path=em_path
+        )
+    except Exception as e:
+        logger.error(f"Error analyzing subject: {e}")
+        return subject, None, []
+    
+    return subject, metric_results, metric_plots
+
+
 def analyze_metric(metric_file, df_markers, comparison_groups, metric, 
                    analysis_method, plot_type, output_folder, subject_suffix='', 
-                   subject_label='', cleaning_enabled=False, cleaning_stages=None):
+                   subject_label='', cleaning_enabled=False, cleaning_stages=None,
+                   plots_enabled=True, df_metric=None, offset=None, event_markers_path=None):
     """
     Analyze a single metric with specified method and generate plots.
     
@@ -521,18 +952,22 @@ def analyze_metric(metric_file, df_markers, comparison_groups, metric,
         analysis_method: Analysis method to apply
         plot_type: Type of plot to generate
         output_folder: Where to save plots
+        plots_enabled: Whether to render plots; False returns statistics only
+        df_metric: Metric DataFrame already loaded from metric_file, if any
+        offset: Timestamp offset of the uncleaned df_metric, if already known
+        event_markers_path: Path df_markers was loaded from; keys the offset cache
         
     Returns:
         Tuple of (metric_results dict, plots list)
     """
-    print(f"Loading: {os.path.basename(metric_file)}")
-    df_metric = pd.read_csv(metric_file)
-    print(f"Loaded {df_metric.shape[0]} rows")
+    if df_metric is None:
+        logger.info(f"Loading: {os.path.basename(metric_file)}")
+        df_metric = _load_metric_cached(metric_file)
+    logger.info(f"Loaded {df_metric.shape[0]} rows")
     
     # Apply data cleaning if enabled
     if cleaning_enabled:
-        from DataCleaner import BiometricDataCleaner
-        cleaner = BiometricDataCleaner(metric_type=metric)
+        cleaner = _get_cleaner(metric)
         metric_col = df_metric.columns[-1]  
         df_metric = cleaner.clean(
             df_metric, 
@@ -542,68 +977,73 @@ def analyze_metric(metric_file, df_markers, comparison_groups, metric,
         )
 
     if len(df_metric) == 0:
-        print(f"ERROR: All data removed during cleaning")
-        print(f"Metric: {metric}")
-        print(f"This suggests the data may be in wrong units or have fundamental issues")
+        logger.error(f"All data removed during cleaning")
+        logger.info(f"Metric: {metric}")
+        logger.info(f"This suggests the data may be in wrong units or have fundamental issues")
         return None, []
     
-    print(f"Calculating timestamp offset...")
-    offset = find_timestamp_offset(df_markers, df_metric)
+    logger.info(f"Calculating timestamp offset...")
+    if cleaning_enabled or not event_markers_path:
+        offset = find_timestamp_offset(df_markers, df_metric)
+    elif offset is None:
+        offset = _cached_timestamp_offset(event_markers_path, metric_file, df_markers, df_metric)
     
     group_data_raw = {}
     
-    for group in comparison_groups:
+    windows = extract_windows_batch(df_metric, df_markers, offset, comparison_groups)
+    for group, data in zip(comparison_groups, windows):
         group_label = group['label']
-        print(f"\nExtracting data for '{group_label}'...")
-        
-        data = extract_window_data(df_metric, df_markers, offset, group)
+        logger.debug(f"Extracted data for '{group_label}'")
         
         if len(data) == 0:
-            print(f"Warning: No data for group '{group_label}' - skipping")
+            logger.warning(f"No data for group '{group_label}' - skipping")
             continue
         
         group_data_raw[group_label] = data
     
     if len(group_data_raw) < 1:
-        print(f"Warning: No groups with data - skipping {metric}")
+        logger.warning(f"No groups with data - skipping {metric}")
         return None, []
     
-    print(f"\nApplying analysis method: {get_method_label(analysis_method)}")
+    logger.info(f"\nApplying analysis method: {get_method_label(analysis_method)}")
     
     metric_col = df_metric.columns[-1]
-    group_data_processed = {}
-    
-    for group_label, data in group_data_raw.items():
-        try:
-            processed_data = apply_analysis_method(data, metric_col, analysis_method)
-            group_data_processed[group_label] = processed_data
-            print(f"Processed '{group_label}': {len(processed_data)} data points")
-        except Exception as e:
-            print(f"Error processing '{group_label}': {e}")
-            continue
+    if analysis_method == 'raw':
+        # Identity transform: the extracted windows are already private copies
+        group_data_processed = group_data_raw
+        logger.info(f"Raw data: {len(group_data_processed)} groups used as extracted")
+    elif not plots_enabled:
+        # Statistics only: the transform is fused into the statistics pass below
+        group_data_processed = group_data_raw
+    else:
+        # One grouped pass over all windows instead of a call per window
+        group_data_processed = apply_group_analysis_method(group_data_raw, metric_col, analysis_method)
     
     if len(group_data_processed) == 0:
-        print(f"Warning: No successfully processed groups - skipping {metric}")
+        logger.warning(f"No successfully processed groups - skipping {metric}")
         return None, []
     
     # Calculate statistics
-    print(f"\nCalculating statistics...")
-    metric_results = {}
+    logger.info(f"\nCalculating statistics...")
+    if plots_enabled:
+        metric_results = calculate_group_statistics(group_data_processed, metric_col, analysis_method)
+    else:
+        metric_results = calculate_group_method_statistics(group_data_raw, metric_col, analysis_method)
     
-    for group_label, data in group_data_processed.items():
-        stats = calculate_statistics(data, metric_col, analysis_method)
-        metric_results[group_label] = stats
-        
-        print(f"{group_label}: mean={stats['mean']:.2f}, std={stats['std']:.2f}, n={stats['count']}")
+    for group_label, stats in metric_results.items():
+        logger.info(f"{group_label}: mean={stats['mean']:.2f}, std={stats['std']:.2f}, n={stats['count']}")
+    
+    if not plots_enabled:
+        return metric_results, []
     
     # Generate plots
-    # Generate plots
-    print(f"\nCreating visualizations (Plot type: {plot_type})...")
+    logger.info(f"\nCreating visualizations (Plot type: {plot_type})...")
     plots = []
     
     # Main plot based on selected type (skip for barchart - it's the comparison plot)
     if plot_type != 'barchart':
-        plot1 = generate_plot(
+        plot1 = _submit_plot(
+            _plot_generator().generate_plot,
             group_data_processed, 
             metric_col, 
             metric, 
@@ -618,7 +1058,8 @@ def analyze_metric(metric_file, df_markers, comparison_groups, metric,
     
     # Comparison/Bar chart - only generate if there's something to compare
     if len(group_data_processed) >= 2:
-        plot2 = generate_comparison_plot(
+        plot2 = _submit_plot(
+            _plot_generator().generate_comparison_plot,
             metric_results, 
             metric, 
             analysis_method,
@@ -629,15 +1070,16 @@ def analyze_metric(metric_file, df_markers, comparison_groups, metric,
         if plot2:
             plots.append(plot2)
     elif plot_type == 'barchart':
-        print(f"Skipping bar chart - only {len(group_data_processed)} event window selected (need 2+ for comparison)")
+        logger.info(f"Skipping bar chart - only {len(group_data_processed)} event window selected (need 2+ for comparison)")
     else:
-        print(f"Skipping comparison plot - single group analysis")
+        logger.info(f"Skipping comparison plot - single group analysis")
     
     return metric_results, plots
 
 def analyze_metric_multi_subject(manifest, selected_subjects, comparison_groups, 
                                   metric, analysis_method, plot_type, output_folder,
-                                  cleaning_enabled=False, cleaning_stages=None):
+                                  cleaning_enabled=False, cleaning_stages=None,
+                                  subject_files_by_subject=None, plots_enabled=True):
     """
     Analyze a metric across multiple subjects (intra-subject analysis).
     Creates subject event combinations for comparison.
@@ -650,11 +1092,14 @@ def analyze_metric_multi_subject(manifest, selected_subjects, comparison_groups,
         analysis_method: Analysis method to apply
         plot_type: Type of plot to generate
         output_folder: Where to save plots
+        subject_files_by_subject: Optional {subject: get_subject_files() result}
+            precomputed by the caller to avoid rescanning the manifest per metric
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         Tuple of (metric_results dict, plots list)
     """
-    print(f"Loading data for {len(selected_subjects)} subjects...")
+    logger.info(f"Loading data for {len(selected_subjects)} subjects...")
     
     # Data structure: {composite_label: DataFrame}
     group_data_raw = {}
@@ -663,37 +1108,48 @@ def analyze_metric_multi_subject(manifest, selected_subjects, comparison_groups,
     # STEP 1: Load data for each subject × event combination
     # ═══════════════════════════════════════════════════════════════
     metric_col_name = None 
+    subject_inputs = []
     for subject in selected_subjects:
-        print(f"\nProcessing subject: {subject}")
-        
         # Get files specific to this subject
-        subject_files = get_subject_files(manifest, subject)
+        if subject_files_by_subject and subject in subject_files_by_subject:
+            subject_files = subject_files_by_subject[subject]
+        else:
+            subject_files = get_subject_files(manifest, subject)
         
         if not subject_files['emotibit_files']:
-            print(f"No EmotiBit files found for {subject} - skipping")
+            logger.info(f"No EmotiBit files found for {subject} - skipping")
             continue
         
         if not subject_files['event_markers']:
-            print(f"No event markers found for {subject} - skipping")
+            logger.info(f"No event markers found for {subject} - skipping")
             continue
         
         # Load metric file for this subject
         metric_file = find_metric_file_for_subject(subject_files, metric)
         if not metric_file:
-            print(f"No {metric} file found for {subject} - skipping")
+            logger.info(f"No {metric} file found for {subject} - skipping")
             continue
         
-        print(f"Loading: {os.path.basename(metric_file)}")
-        df_metric = pd.read_csv(metric_file)
+        subject_inputs.append((subject, subject_files, metric_file))
+    
+    # Front-load every subject's metric file so disk waits overlap
+    metric_frames = read_csv_files_concurrently(
+        [metric_file for _, _, metric_file in subject_inputs],
+        reader=_load_metric_cached
+    )
+    
+    for subject, subject_files, metric_file in subject_inputs:
+        logger.info(f"\nProcessing subject: {subject}")
+        logger.info(f"Loading: {os.path.basename(metric_file)}")
+        df_metric = metric_frames[metric_file]
         
         if metric_col_name is None:
             metric_col_name = df_metric.columns[-1]
-            print(f"Detected metric column: '{metric_col_name}'")
+            logger.info(f"Detected metric column: '{metric_col_name}'")
 
         # Apply data cleaning if enabled
         if cleaning_enabled:
-            from DataCleaner import BiometricDataCleaner
-            cleaner = BiometricDataCleaner(metric_type=metric)
+            cleaner = _get_cleaner(metric)
            
             df_metric = cleaner.clean(
                 df_metric,
@@ -703,80 +1159,84 @@ def analyze_metric_multi_subject(manifest, selected_subjects, comparison_groups,
             )
         
         if len(df_metric) == 0:
-            print(f"WARNING: All data removed during cleaning for {subject}")
-            print(f"This suggests the data may be in wrong units or have fundamental issues")
-            print(f"Skipping this subject...")
+            logger.warning(f"All data removed during cleaning for {subject}")
+            logger.info(f"This suggests the data may be in wrong units or have fundamental issues")
+            logger.info(f"Skipping this subject...")
             continue
 
         event_markers_path = subject_files['event_markers']['path']
-        print(f"Loading: {os.path.basename(event_markers_path)}")
-        df_markers = pd.read_csv(event_markers_path)
-        df_markers = prepare_event_markers_timestamps(df_markers)
+        logger.info(f"Loading: {os.path.basename(event_markers_path)}")
+        df_markers = _load_event_markers(event_markers_path)
         
-        print(f"Calculating timestamp offset...")
-        offset = find_timestamp_offset(df_markers, df_metric)
+        logger.info(f"Calculating timestamp offset...")
+        if cleaning_enabled:
+            offset = find_timestamp_offset(df_markers, df_metric)
+        else:
+            offset = _cached_timestamp_offset(event_markers_path, metric_file, df_markers, df_metric)
         
-        for group in comparison_groups:
+        windows = extract_windows_batch(df_metric, df_markers, offset, comparison_groups)
+        for group, data in zip(comparison_groups, windows):
             group_label = group['label']
             composite_label = f"{subject} - {group_label}"
             
-            print(f"Extracting: {composite_label}")
-            
-            data = extract_window_data(df_metric, df_markers, offset, group)
-            
             if len(data) == 0:
-                print(f"No data found - skipping")
+                logger.info(f"{composite_label}: no data found - skipping")
                 continue
             
             group_data_raw[composite_label] = data
-            print(f"{len(data)} data points")
+            logger.debug(f"{composite_label}: {len(data)} data points")
     
     if len(group_data_raw) == 0:
-        print(f"Warning: No data extracted for any subject-event combination")
+        logger.warning(f"No data extracted for any subject-event combination")
         return None, []
     
-    print(f"\nSuccessfully loaded {len(group_data_raw)} subject-event combinations")
+    logger.info(f"\nSuccessfully loaded {len(group_data_raw)} subject-event combinations")
     
     # ═══════════════════════════════════════════════════════════
     # STEP 2: Apply analysis method to all combinations
     # ═══════════════════════════════════════════════════════════
-    print(f"\nApplying analysis method: {get_method_label(analysis_method)}")
-    print(f"Using metric column: '{metric_col_name}'")
+    logger.info(f"\nApplying analysis method: {get_method_label(analysis_method)}")
+    logger.info(f"Using metric column: '{metric_col_name}'")
 
-    group_data_processed = {}
-    
-    for composite_label, data in group_data_raw.items():
-        try:
-            processed_data = apply_analysis_method(data, metric_col_name, analysis_method)
-            group_data_processed[composite_label] = processed_data
-            print(f"{composite_label}: {len(processed_data)} points")
-        except Exception as e:
-            print(f"Error processing '{composite_label}': {e}")
-            continue
+    if analysis_method == 'raw':
+        # Identity transform: the extracted windows are already private copies
+        group_data_processed = group_data_raw
+        logger.info(f"Raw data: {len(group_data_processed)} subject-event combinations used as extracted")
+    elif not plots_enabled:
+        # Statistics only: the transform is fused into the statistics pass below
+        group_data_processed = group_data_raw
+    else:
+        # One grouped pass over all windows instead of a call per window
+        group_data_processed = apply_group_analysis_method(group_data_raw, metric_col_name, analysis_method)
     
     if len(group_data_processed) == 0:
-        print(f"Warning: No successfully processed data")
+        logger.warning(f"No successfully processed data")
         return None, []
     
     # ═══════════════════════════════════════════════════════════════
     # STEP 3: Calculate statistics for all combinations
     # ═══════════════════════════════════════════════════════════════
-    print(f"\nCalculating statistics...")
-    metric_results = {}
+    logger.info(f"\nCalculating statistics...")
+    if plots_enabled:
+        metric_results = calculate_group_statistics(group_data_processed, metric_col_name, analysis_method)
+    else:
+        metric_results = calculate_group_method_statistics(group_data_raw, metric_col_name, analysis_method)
     
-    for composite_label, data in group_data_processed.items():
-        stats = calculate_statistics(data, metric_col_name, analysis_method)
-        metric_results[composite_label] = stats
-        print(f"{composite_label}: mean={stats['mean']:.2f}, std={stats['std']:.2f}, n={stats['count']}")
+    for composite_label, stats in metric_results.items():
+        logger.info(f"{composite_label}: mean={stats['mean']:.2f}, std={stats['std']:.2f}, n={stats['count']}")
+    
+    if not plots_enabled:
+        return metric_results, []
     
     # ═══════════════════════════════════════════════════════════════
     # STEP 4: Generate visualizations
     # ═══════════════════════════════════════════════════════════════
-    print(f"\nCreating visualizations (Plot type: {plot_type})...")
+    logger.info(f"\nCreating visualizations (Plot type: {plot_type})...")
     plots = []
     
     if plot_type != 'barchart':
-        plot1 = generate_plot(
+        plot1 = _submit_plot(
+            _plot_generator().generate_plot,
             group_data_processed, 
             metric_col_name,  # ✅ Use metric_col_name
             metric, 
@@ -789,7 +1249,8 @@ def analyze_metric_multi_subject(manifest, selected_subjects, comparison_groups,
             plots.append(plot1)
     
     if len(group_data_processed) >= 2:
-        plot2 = generate_comparison_plot(
+        plot2 = _submit_plot(
+            _plot_generator().generate_comparison_plot,
             metric_results, 
             metric, 
             analysis_method,
@@ -799,16 +1260,17 @@ def analyze_metric_multi_subject(manifest, selected_subjects, comparison_groups,
         if plot2:
             plots.append(plot2)
     elif plot_type == 'barchart':
-        print(f"Skipping bar chart - only {len(group_data_processed)} event window selected (need 2+ for comparison)")
+        logger.info(f"Skipping bar chart - only {len(group_data_processed)} event window selected (need 2+ for comparison)")
     
     return metric_results, plots
 
-def analyze_hrv_from_ppg(manifest, df_markers, comparison_groups, output_folder):
+def analyze_hrv_from_ppg(manifest, df_markers, comparison_groups, output_folder,
+                         plots_enabled=True):
     """
-    Analyze HRV from PPG signals.
-    [PRESERVED - No changes to this function]
+    Analyze HRV from PPG signals. With plots_enabled=False the domain
+    indices are computed without drawing any figures.
     """
-    print("Loading PPG data files...")
+    logger.info("Loading PPG data files...")
     
     pi_file = None
     for emotibit_file in manifest['emotibit_files']:
@@ -819,17 +1281,63 @@ def analyze_hrv_from_ppg(manifest, df_markers, comparison_groups, output_folder)
     if not pi_file:
         raise FileNotFoundError("PI (Infrared) PPG file not found")
     
-    print(f"Found PI file")
+    logger.info(f"Found PI file")
     
-    pi_data = pd.read_csv(pi_file)
-    pi_signal = pi_data.iloc[:, -1].values
-    timestamps = pi_data['LocalTimestamp'].values
+    return _analyze_hrv_file(pi_file, output_folder, plots_enabled=plots_enabled)
+
+
+def _hrv_one_subject(subject, manifest, output_folder, plots_enabled=True):
+    """
+    Batch-mode HRV worker: analyze one subject's PI (Infrared) PPG file.
+    Kept at module level so it can run in a worker process.
     
-    sampling_rate = int(round(1 / np.mean(np.diff(timestamps))))
-    pi_signal = pi_signal[~np.isnan(pi_signal)]
+    Returns:
+        Tuple of (subject, hrv results dict or None, plots list, error message or None)
+    """
+    pi_file = find_metric_file_for_subject(get_subject_files(manifest, subject), 'PI')
+    if not pi_file:
+        return subject, None, [], "PI (Infrared) PPG file not found"
+    
+    logger.info(f"HRV for {subject}: {os.path.basename(pi_file)}")
+    try:
+        subject_short = subject[:30]  # Same filename suffix as the metric plots
+        hrv_results, hrv_plots = _analyze_hrv_file(
+            pi_file,
+            output_folder,
+            plots_enabled=plots_enabled,
+            suffix=f"_{subject_short}",
+            subject_label=subject
+        )
+    except Exception as e:
+        logger.exception(f"Error analyzing HRV for {subject}: {e}")
+        return subject, None, [], str(e)
+    
+    return subject, hrv_results, hrv_plots, None
+
+
+def _analyze_hrv_file(pi_file, output_folder, plots_enabled=True, suffix='', subject_label=''):
+    """
+    Process one PI (Infrared) PPG file and compute its HRV indices.
+    suffix and subject_label distinguish the figures of different subjects.
+    
+    Returns:
+        Tuple of (hrv results dict, plots list)
+    """
+    pi_data = _load_metric_cached(pi_file)
+    timestamps = pi_data['LocalTimestamp'].to_numpy(dtype=np.float64, copy=False)
+    # Mean sample interval: the first differences telescope to the endpoints
+    sampling_rate = int(round((len(timestamps) - 1) / (timestamps[-1] - timestamps[0])))
+    
+    # Fill dropouts rather than removing them so the signal stays time-aligned.
+    # float32 is ample for sensor precision and halves the filters' input.
+    pi_values = pi_data.iloc[:, -1]
+    if pi_values.hasnans:
+        pi_values = pi_values.interpolate(method='linear', limit_direction='both')
+    pi_signal = pi_values.to_numpy(dtype=np.float32, copy=False)
+    nk = _neurokit()
     pi_cleaned = nk.ppg_clean(pi_signal, sampling_rate=sampling_rate)
     
-    print(f"Processing PPG signal...")
+    logger.info(f"Processing PPG signal...")
     signals, info = nk.ppg_process(pi_cleaned, sampling_rate=sampling_rate)
     peaks = info["PPG_Peaks"]
     
@@ -837,24 +1345,46 @@ def analyze_hrv_from_ppg(manifest, df_markers, comparison_groups, output_folder)
     duration = len(pi_signal) / sampling_rate / 60
     avg_hr = num_peaks / duration if duration > 0 else 0
     
-    print(f"Detected {num_peaks} peaks, {duration:.2f} min, {avg_hr:.2f} bpm")
-    
-    # Calculate HRV
-    hrv_indices = nk.hrv(peaks, sampling_rate=sampling_rate, show=False)
+    logger.info(f"Detected {num_peaks} peaks, {duration:.2f} min, {avg_hr:.2f} bpm")
+    
+    # Each domain is computed once: the call that draws its plot also
+    # returns its indices, so nk.hrv() no longer recomputes all three.
+    # The four figures are independent and render in worker processes.
+    domains = list(HRV_DOMAIN_FUNCTIONS)
+    if duration < HRV_MIN_FREQUENCY_MINUTES:
+        # LF/HF power needs several minutes of beats; Welch on less is noise
+        logger.info(f"Recording shorter than {HRV_MIN_FREQUENCY_MINUTES} min - skipping frequency domain HRV")
+        domains.remove('frequency')
+    elif num_peaks < HRV_MIN_FREQUENCY_PEAKS:
+        logger.info(f"Fewer than {HRV_MIN_FREQUENCY_PEAKS} peaks - skipping frequency domain HRV")
+        domains.remove('frequency')
+    
+    if plots_enabled:
+        plot_tasks = [(signals, info, 'signal')]
+        plot_tasks += [(peaks, sampling_rate, plot_type) for plot_type in domains]
+        plot_outputs = _render_hrv_plots(plot_tasks, output_folder, suffix, subject_label)
+        plots = [plot for plot, _ in plot_outputs]
+        plotted_indices = [indices for _, indices in plot_outputs[1:]]
+    else:
+        plots = []
+        plotted_indices = [None] * len(domains)
+    
+    domain_indices = {}
+    for indices, plot_type in zip(plotted_indices, domains):
+        if indices is None:
+            domain_fn = getattr(nk, HRV_DOMAIN_FUNCTIONS[plot_type])
+            indices = domain_fn(peaks, sampling_rate=sampling_rate, show=False)
+        domain_indices[plot_type] = indices
+    
+    # Indices in nk.hrv() column order; a skipped frequency domain keeps its
+    # keys, as None, so every recording reports the same set of indices.
+    # NaN stays a float, which the results writer stores as 0.0.
     hrv_dict = {}
-    for key, value in hrv_indices.to_dict('records')[0].items():
-        if isinstance(value, (np.integer, np.floating)):
-            hrv_dict[key] = float(value)
-        elif pd.isna(value):
-            hrv_dict[key] = None
+    for plot_type in HRV_DOMAIN_FUNCTIONS:
+        if plot_type in domain_indices:
+            hrv_dict.update(domain_indices[plot_type].iloc[0].to_dict())
         else:
-            hrv_dict[key] = value
-    
-    plots = []
-    plots.append(generate_hrv_plot(signals, info, 'signal', output_folder))
-    plots.append(generate_hrv_plot(peaks, sampling_rate, 'time', output_folder))
-    plots.append(generate_hrv_plot(peaks, sampling_rate, 'frequency', output_folder))
-    plots.append(generate_hrv_plot(peaks, sampling_rate, 'nonlinear', output_folder))
+            hrv_dict.update(dict.fromkeys(HRV_FREQUENCY_INDICES))
     
     return {
         'num_peaks': int(num_peaks),
@@ -865,94 +1395,180 @@ def analyze_hrv_from_ppg(manifest, df_markers, comparison_groups, output_folder)
     }, [p for p in plots if p]
 
 
-def generate_hrv_plot(data, param, plot_type, output_folder):
+def _decimate_lines(fig, max_points):
+    """
+    Thin every line in fig that has more than max_points vertices by keeping
+    the minimum and maximum of each of max_points // 2 equal index buckets,
+    so spikes and dropouts stay visible. Markers and collections are untouched.
+    """
+    n_buckets = max_points // 2
+    for ax in fig.get_axes():
+        for line in ax.get_lines():
+            y = np.asarray(line.get_ydata(), dtype=np.float64)
+            n = len(y)
+            if n <= max_points:
+                continue
+            x = np.asarray(line.get_xdata(), dtype=np.float64)
+            
+            # Pad with the last sample so the buckets tile the signal exactly
+            bucket = -(-n // n_buckets)
+            padded = np.concatenate([y, np.repeat(y[-1], n_buckets * bucket - n)]).reshape(n_buckets, bucket)
+            starts = np.arange(n_buckets) * bucket
+            lows = starts + np.argmin(np.where(np.isnan(padded), np.inf, padded), axis=1)
+            highs = starts + np.argmax(np.where(np.isnan(padded), -np.inf, padded), axis=1)
+            
+            keep = np.unique(np.minimum(np.concatenate([lows, highs, [0, n - 1]]), n - 1))
+            line.set_data(x[keep], y[keep])
+
+
+def _hrv_plot_cache_key(data, param, plot_type):
     """
-    Generate HRV plots with proper spacing.
-    [PRESERVED - No changes to this function]
+    SHA-1 of everything an HRV figure depends on: the PPG signals frame and
+    sampling rate for 'signal', the peak indices and sampling rate for the
+    domain plots, plus the figure spec so layout changes invalidate it.
     """
+    digest = hashlib.sha1()
+    digest.update(plot_type.encode())
+    digest.update(repr((HRV_PLOT_SPECS[plot_type], HRV_SIGNAL_MAX_POINTS)).encode())
+    
+    if plot_type == 'signal':
+        signals, info = data, param
+        digest.update(pd.util.hash_pandas_object(signals, index=False).to_numpy().tobytes())
+        digest.update(str(info.get('sampling_rate')).encode())
+    else:
+        peaks, sampling_rate = data, param
+        digest.update(np.ascontiguousarray(peaks, dtype=np.int64).tobytes())
+        digest.update(str(sampling_rate).encode())
+    
+    return digest.hexdigest()
+
+
+def _read_hrv_plot_cache(plot_path, cache_key):
+    """
+    Look up the sidecar written next to an HRV figure.
+    
+    Returns:
+        (hit, indices) - indices is the cached single-row DataFrame of the
+        domain function, or None for 'signal' and on a miss
+    """
+    sidecar_path = plot_path + '.sha1'
+    if not (os.path.exists(plot_path) and os.path.exists(sidecar_path)):
+        return False, None
+    
     try:
+        with open(sidecar_path) as f:
+            sidecar = json.load(f)
+    except (OSError, ValueError):
+        return False, None
+    
+    if sidecar.get('key') != cache_key:
+        return False, None
+    
+    if sidecar.get('columns') is None:
+        return True, None
+    return True, pd.DataFrame([sidecar['values']], columns=sidecar['columns'])
+
+
+def _write_hrv_plot_cache(plot_path, cache_key, indices):
+    """
+    Record the cache key (and domain indices, if any) for a freshly saved
+    HRV figure. Written atomically; failures only cost the next rerun.
+    """
+    sidecar = {'key': cache_key, 'columns': None, 'values': None}
+    if indices is not None:
+        sidecar['columns'] = list(indices.columns)
+        sidecar['values'] = indices.iloc[0].tolist()
+    
+    sidecar_path = plot_path + '.sha1'
+    try:
+        with open(sidecar_path + '.tmp', 'w') as f:
+            json.dump(sidecar, f)
+        os.replace(sidecar_path + '.tmp', sidecar_path)
+    except OSError as e:
+        logger.warning(f"Could not write HRV plot cache for {os.path.basename(plot_path)}: {e}")
+
+
+def generate_hrv_plot(data, param, plot_type, output_folder, suffix='', subject_label=''):
+    """
+    Generate HRV plots with proper spacing. suffix is inserted before the
+    file extension and subject_label is appended to the display name.
+    
+    Returns:
+        (plot_info, indices) - indices is the DataFrame returned by the
+        domain function ('time', 'frequency', 'nonlinear'), None for 'signal'
+    """
+    # NeuroKit draws through pyplot, which is likewise only loaded for HRV
+    import matplotlib.pyplot as plt
+    nk = _neurokit()
+    indices = None
+    # Only close the figures this call opens, never other callers' figures
+    figures_before = set(plt.get_fignums())
+    try:
+        size, title, tick_size, filename, name = HRV_PLOT_SPECS[plot_type]
+        if suffix:
+            stem, ext = os.path.splitext(filename)
+            filename = f"{stem}{suffix}{ext}"
+        if subject_label:
+            name = f"{name} ({subject_label})"
+        plot_path = os.path.join(output_folder, filename)
+        plot_info = {'name': name, 'path': plot_path, 'filename': filename, 'url': f'/api/plot/{filename}'}
+        
+        # Reruns on unchanged data reuse the saved PNG and its indices
+        cache_key = _hrv_plot_cache_key(data, param, plot_type)
+        cached, cached_indices = _read_hrv_plot_cache(plot_path, cache_key)
+        if cached:
+            logger.info(f"Reused: {filename}")
+            return plot_info, cached_indices
+        
         if plot_type == 'signal':
             signals, info = data, param
             nk.ppg_plot(signals, info)
-            fig = plt.gcf()
-            fig.set_size_inches(20, 22)
-            fig.suptitle('PPG Signal with Detected Peaks', fontsize=24, fontweight='bold', y=0.995)
-            for ax in fig.get_axes():
-                ax.tick_params(axis='both', which='major', labelsize=12)
-                ax.xaxis.label.set_fontsize(16)
-                ax.yaxis.label.set_fontsize(16)
-                legend = ax.get_legend()
-                if legend:
-                    for text in legend.get_texts():
-                        text.set_fontsize(16)
-            filename = 'HRV_ppg_signal.png'
-            name = 'HRV - PPG Signal with Peaks'
-            
-        elif plot_type == 'time':
-            peaks, sampling_rate = data, param
-            nk.hrv_time(peaks, sampling_rate=sampling_rate, show=True)
-            fig = plt.gcf()
-            fig.set_size_inches(20, 20)
-            fig.suptitle('Time Domain HRV', fontsize=24, fontweight='bold', y=0.995)
-            for ax in fig.get_axes():
-                ax.tick_params(axis='both', which='major', labelsize=18)
-                ax.xaxis.label.set_fontsize(16)
-                ax.yaxis.label.set_fontsize(16)
-                legend = ax.get_legend()
-                if legend:
-                    for text in legend.get_texts():
-                        text.set_fontsize(16)
-            filename = 'HRV_time_domain.png'
-            name = 'HRV - Time Domain'
-            
-        elif plot_type == 'frequency':
-            peaks, sampling_rate = data, param
-            nk.hrv_frequency(peaks, sampling_rate=sampling_rate, show=True)
-            fig = plt.gcf()
-            fig.set_size_inches(20, 18)
-            fig.suptitle('Frequency Domain HRV', fontsize=24, fontweight='bold', y=0.995)
-            for ax in fig.get_axes():
-                ax.tick_params(axis='both', which='major', labelsize=18)
-                ax.xaxis.label.set_fontsize(16)
-                ax.yaxis.label.set_fontsize(16)
-                legend = ax.get_legend()
-                if legend:
-                    for text in legend.get_texts():
-                        text.set_fontsize(16)
-            filename = 'HRV_frequency_domain.png'
-            name = 'HRV - Frequency Domain'
-            
-        elif plot_type == 'nonlinear':
+            # NeuroKit segments beats on the full signal; only the drawn
+            # traces are thinned, so long sessions don't cost one vertex per sample
+            _decimate_lines(plt.gcf(), HRV_SIGNAL_MAX_POINTS)
+        else:
             peaks, sampling_rate = data, param
-            nk.hrv_nonlinear(peaks, sampling_rate=sampling_rate, show=True)
-            fig = plt.gcf()
-            fig.set_size_inches(22, 20)
-            fig.suptitle('Non-linear HRV', fontsize=24, fontweight='bold', y=0.995)
-            for ax in fig.get_axes():
-                ax.tick_params(axis='both', which='major', labelsize=18)
-                ax.xaxis.label.set_fontsize(16)
-                ax.yaxis.label.set_fontsize(16)
-                legend = ax.get_legend()
-                if legend:
-                    for text in legend.get_texts():
-                        text.set_fontsize(16)
-            filename = 'HRV_nonlinear.png'
-            name = 'HRV - Non-linear'
+            if plot_type == 'frequency' and len(peaks) < HRV_MIN_FREQUENCY_PEAKS:
+                logger.info(f"Fewer than {HRV_MIN_FREQUENCY_PEAKS} peaks - skipping {plot_type} plot")
+                return None, None
+            domain_fn = getattr(nk, HRV_DOMAIN_FUNCTIONS[plot_type])
+            indices = domain_fn(peaks, sampling_rate=sampling_rate, show=True)
         
-        plot_path = os.path.join(output_folder, filename)
-        plt.savefig(plot_path, dpi=100, bbox_inches='tight', pad_inches=0.5)
-        plt.close(fig)
+        fig = plt.gcf()
+        fig.set_size_inches(*size)
+        fig.suptitle(title, fontsize=24, fontweight='bold', y=0.995)
+        for ax in fig.get_axes():
+            ax.tick_params(axis='both', which='major', labelsize=tick_size)
+            ax.xaxis.label.set_fontsize(16)
+            ax.yaxis.label.set_fontsize(16)
+            legend = ax.get_legend()
+            if legend:
+                for text in legend.get_texts():
+                    text.set_fontsize(16)
+        
+        # The figures are 20-22 inches across; 60 dpi keeps the layout and
+        # font proportions while writing ~1200px instead of ~2000px PNGs.
+        # Written to a temporary name first so a cache sidecar never
+        # describes a half-written image.
+        temp_path = plot_path + '.tmp'
+        image_format = os.path.splitext(filename)[1][1:]
+        fig.savefig(temp_path, format=image_format, dpi=60, bbox_inches='tight', pad_inches=0.5)
+        os.replace(temp_path, plot_path)
+        _write_hrv_plot_cache(plot_path, cache_key, indices)
         
-        print(f"Saved: {filename}")
-        return {'name': name, 'path': plot_path, 'filename': filename, 'url': f'/api/plot/{filename}'}
+        logger.info(f"Saved: {filename}")
+        return plot_info, indices
     except Exception as e:
-        print(f"Could not generate {plot_type} plot: {e}")
-        plt.close('all')
-        return None
+        logger.warning(f"Could not generate {plot_type} plot: {e}", exc_info=True)
+        return None, indices
+    finally:
+        for number in set(plt.get_fignums()) - figures_before:
+            plt.close(number)
     
 def analyze_external_data(manifest, external_configs, comparison_groups, output_folder,
                           batch_mode=False, selected_subjects=None, analysis_method='raw',
-                          plot_type='lineplot', cleaning_enabled=False, cleaning_stages=None):
+                          plot_type='lineplot', cleaning_enabled=False, cleaning_stages=None,
+                          plots_enabled=True):
     """
     Analyze external CSV data files based on user configuration.
     
@@ -967,79 +1583,126 @@ def analyze_external_data(manifest, external_configs, comparison_groups, output_
         plot_type: Type of visualization
         cleaning_enabled: Whether to apply data cleaning
         cleaning_stages: Which cleaning stages to apply
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         Tuple of (results_dict, plots_list)
     """
-    print(f"  Processing external data files from {len(external_configs)} subject(s)")
+    logger.info(f"  Processing external data files from {len(external_configs)} subject(s)")
     
     all_results = {}
     all_plots = []
+    subjects = []
     
-    # Process each subject's external files
-    for subject, files_config in external_configs.items():
-        print(f"\n  Subject: {subject}")
-        
+    # Subjects are processed independently, in worker processes when possible
+    for subject in external_configs:
         # Skip if subject not selected
         if batch_mode and selected_subjects and subject not in selected_subjects:
-            print(f"    Skipping (not in selected subjects)")
+            logger.info(f"  Skipping {subject} (not in selected subjects)")
             continue
         
-        # Load event markers for this subject
-        df_markers = load_event_markers_for_subject(manifest, subject, batch_mode)
-        if df_markers is None:
-            print(f"    No event markers found - skipping")
+        subjects.append(subject)
+    
+    subject_outputs = _map_subjects(
+        _analyze_external_subject,
+        subjects,
+        manifest,
+        external_configs,
+        comparison_groups,
+        output_folder,
+        batch_mode=batch_mode,
+        analysis_method=analysis_method,
+        plot_type=plot_type,
+        cleaning_enabled=cleaning_enabled,
+        cleaning_stages=cleaning_stages,
+        plots_enabled=plots_enabled
+    )
+    for subject_results, subject_plots in subject_outputs:
+        all_results.update(subject_results)
+        all_plots.extend(subject_plots)
+    
+    logger.info(f"\n  External data analysis complete: {len(all_results)} data series processed")
+    return all_results, all_plots
+
+
+def _analyze_external_subject(subject, manifest, external_configs, comparison_groups, output_folder,
+                              batch_mode=False, analysis_method='raw', plot_type='lineplot',
+                              cleaning_enabled=False, cleaning_stages=None, plots_enabled=True):
+    """
+    External-data worker: process every selected file and data column of
+    one subject. Kept at module level so it can run in a worker process.
+    
+    Returns:
+        Tuple of (results_dict, plots_list) for this subject
+    """
+    files_config = external_configs[subject]
+    subject_results = {}
+    subject_plots = []
+    
+    logger.info(f"\n  Subject: {subject}")
+    
+    # Load event markers for this subject
+    df_markers = load_event_markers_for_subject(manifest, subject, batch_mode)
+    if df_markers is None:
+        logger.info(f"    No event markers found - skipping")
+        return subject_results, subject_plots
+    
+    # Alignment anchor for relative timestamps, shared by all files and columns
+    first_event_time = df_markers['unix_timestamp'].min()
+    
+    # One pass over the manifest instead of one scan per configured file
+    external_files = _index_external_files(manifest, subject)
+    
+    # Process each selected external file for this subject
+    for filename, config in files_config.items():
+        if not config.get('selected', True):
+            logger.info(f"    Skipping {filename} (not selected)")
             continue
         
-        # Process each selected external file for this subject
-        for filename, config in files_config.items():
-            if not config.get('selected', True):
-                print(f"    Skipping {filename} (not selected)")
-                continue
-            
-            print(f"\n    Processing: {filename}")
-            
-            # Find the file in manifest
-            external_file = find_external_file_in_manifest(manifest, subject, filename)
-            if not external_file:
-                print(f"      File not found in manifest")
+        logger.info(f"\n    Processing: {filename}")
+        
+        # Find the file in manifest
+        external_file = external_files.get(filename)
+        if not external_file:
+            logger.info(f"      File not found in manifest")
+            continue
+        
+        # Process each configured data column
+        for data_col_config in config.get('dataColumns', []):
+            if not data_col_config.get('column'):
                 continue
             
-            # Process each configured data column
-            for data_col_config in config.get('dataColumns', []):
-                if not data_col_config.get('column'):
-                    continue
+            try:
+                results, plots = process_external_file_column(
+                    external_file['path'],
+                    config,
+                    data_col_config,
+                    df_markers,
+                    comparison_groups,
+                    analysis_method,
+                    plot_type,
+                    output_folder,
+                    subject_label=subject,
+                    filename_label=filename,
+                    cleaning_enabled=cleaning_enabled,
+                    cleaning_stages=cleaning_stages,
+                    plots_enabled=plots_enabled,
+                    first_event_time=first_event_time
+                )
                 
-                try:
-                    results, plots = process_external_file_column(
-                        external_file['path'],
-                        config,
-                        data_col_config,
-                        df_markers,
-                        comparison_groups,
-                        analysis_method,
-                        plot_type,
-                        output_folder,
-                        subject_label=subject,
-                        filename_label=filename,
-                        cleaning_enabled=cleaning_enabled,
-                        cleaning_stages=cleaning_stages
-                    )
-                    
-                    if results:
-                        # Create composite label
-                        display_name = data_col_config.get('displayName') or data_col_config['column']
-                        composite_label = f"{subject} - {filename} - {display_name}"
-                        
-                        all_results[composite_label] = results
-                        all_plots.extend(plots)
+                if results:
+                    # Create composite label
+                    display_name = data_col_config.get('displayName') or data_col_config['column']
+                    composite_label = f"{subject} - {filename} - {display_name}"
                     
-                except Exception as e:
-                    print(f"      Error processing column {data_col_config['column']}: {e}")
-                    continue
+                    subject_results[composite_label] = results
+                    subject_plots.extend(plots)
+                
+            except Exception as e:
+                logger.error(f"      Error processing column {data_col_config['column']}: {e}")
+                continue
     
-    print(f"\n  External data analysis complete: {len(all_results)} data series processed")
-    return all_results, all_plots
+    return subject_results, subject_plots
 
 
 def load_event_markers_for_subject(manifest, subject, batch_mode):
@@ -1052,22 +1715,27 @@ def load_event_markers_for_subject(manifest, subject, batch_mode):
     if not em_info:
         return None
     
-    df = pd.read_csv(em_info['path'])
-    return prepare_event_markers_timestamps(df)
+    # Shared through the event markers cache - callers only read the frame
+    return _load_event_markers(em_info['path'])
 
 
-def find_external_file_in_manifest(manifest, subject, filename):
-    """Find external file entry in manifest."""
+def _index_external_files(manifest, subject):
+    """
+    Map filename -> external file entry for one subject. The first entry
+    wins when a filename is listed more than once.
+    """
+    external_files = {}
     for ext_file in manifest.get('external_files', []):
-        if ext_file.get('subject') == subject and ext_file.get('filename') == filename:
-            return ext_file
-    return None
+        if ext_file.get('subject') == subject:
+            external_files.setdefault(ext_file.get('filename'), ext_file)
+    return external_files
 
 
 def process_external_file_column(file_path, config, data_col_config, df_markers,
                                   comparison_groups, analysis_method, plot_type,
                                   output_folder, subject_label='', filename_label='',
-                                  cleaning_enabled=False, cleaning_stages=None):
+                                  cleaning_enabled=False, cleaning_stages=None,
+                                  plots_enabled=True, first_event_time=None):
     """
     Process a single data column from an external CSV file.
     
@@ -1084,22 +1752,24 @@ def process_external_file_column(file_path, config, data_col_config, df_markers,
         filename_label: Filename for labeling
         cleaning_enabled: Whether to clean data
         cleaning_stages: Cleaning stages to apply
+        plots_enabled: Whether to render plots; False returns statistics only
+        first_event_time: Earliest event marker time, computed from df_markers if None
         
     Returns:
         Tuple of (results_dict, plots_list)
     """
-    print(f"      Loading column: {data_col_config['column']}")
-    
-    # Load external CSV
-    df = pd.read_csv(file_path)
+    logger.info(f"      Loading column: {data_col_config['column']}")
     
     # Get column names from config
     timestamp_col = config['timestampColumn']
     data_col = data_col_config['column']
     display_name = data_col_config.get('displayName') or data_col
     
+    # Load external CSV - only the two columns this call uses are parsed
+    df = pd.read_csv(file_path, usecols=lambda col: col in (timestamp_col, data_col))
+    
     if timestamp_col not in df.columns or data_col not in df.columns:
-        print(f"        ERROR: Required columns not found")
+        logger.error(f"        Required columns not found")
         return None, []
     
     # Convert timestamp to unix format based on user's selection
@@ -1123,10 +1793,9 @@ def process_external_file_column(file_path, config, data_col_config, df_markers,
     
     # Apply data cleaning if enabled
     if cleaning_enabled:
-        from DataCleaner import BiometricDataCleaner
         # Try to infer metric type from display name, otherwise use generic
         metric_type = 'default'
-        cleaner = BiometricDataCleaner(metric_type=metric_type)
+        cleaner = _get_cleaner(metric_type)
         df_processed = cleaner.clean(
             df_processed,
             data_col,
@@ -1135,52 +1804,46 @@ def process_external_file_column(file_path, config, data_col_config, df_markers,
         )
     
     if len(df_processed) == 0:
-        print(f"        WARNING: All data removed during cleaning")
+        logger.warning(f"        All data removed during cleaning")
         return None, []
     
     # Calculate timestamp offset (external data might start at different time)
     # If format is 'seconds' or 'milliseconds', we need to align with event markers
     if timestamp_format in ['seconds', 'milliseconds']:
         # Assume external data starts at same time as first event marker
-        first_event_time = df_markers['unix_timestamp'].min()
+        if first_event_time is None:
+            first_event_time = df_markers['unix_timestamp'].min()
         first_data_time = df_processed['LocalTimestamp'].min()
         offset = first_event_time - first_data_time
     else:
         # Unix timestamp - calculate offset normally
         offset = find_timestamp_offset(df_markers, df_processed)
     
-    print(f"        Timestamp offset: {offset:.2f}s")
+    logger.info(f"        Timestamp offset: {offset:.2f}s")
     
     # Extract data for each comparison group
     group_data_raw = {}
     
-    for group in comparison_groups:
+    windows = extract_windows_batch(df_processed, df_markers, offset, comparison_groups)
+    for group, data in zip(comparison_groups, windows):
         group_label = group['label']
-        data = extract_window_data(df_processed, df_markers, offset, group)
         
         if len(data) > 0:
             group_data_raw[group_label] = data
-            print(f"        {group_label}: {len(data)} points")
+            logger.info(f"        {group_label}: {len(data)} points")
     
     if len(group_data_raw) == 0:
-        print(f"        No data extracted for any event")
+        logger.info(f"        No data extracted for any event")
         return None, []
     
-    # Apply analysis method
-    group_data_processed = {}
-    for group_label, data in group_data_raw.items():
-        try:
-            processed = apply_analysis_method(data, data_col, analysis_method)
-            group_data_processed[group_label] = processed
-        except Exception as e:
-            print(f"        Error processing {group_label}: {e}")
-            continue
+    # Apply analysis method - one grouped pass over all windows
+    group_data_processed = apply_group_analysis_method(group_data_raw, data_col, analysis_method)
     
-    # Calculate statistics
-    results = {}
-    for group_label, data in group_data_processed.items():
-        stats = calculate_statistics(data, data_col, analysis_method)
-        results[group_label] = stats
+    # Calculate statistics for all groups in one grouped pass
+    results = calculate_group_statistics(group_data_processed, data_col, analysis_method)
+    
+    if not plots_enabled:
+        return results, []
     
     # Generate plots
     plots = []
@@ -1188,7 +1851,8 @@ def process_external_file_column(file_path, config, data_col_config, df_markers,
     # Main plot
     if plot_type != 'barchart':
         suffix = f"_ext_{subject_label}_{filename_label.replace('.csv', '')}"
-        plot = generate_plot(
+        plot = _submit_plot(
+            _plot_generator().generate_plot,
             group_data_processed,
             data_col,
             display_name,
@@ -1204,7 +1868,8 @@ def process_external_file_column(file_path, config, data_col_config, df_markers,
     # Comparison plot
     if len(group_data_processed) >= 2:
         suffix = f"_ext_{subject_label}_{filename_label.replace('.csv', '')}"
-        comp_plot = generate_comparison_plot(
+        comp_plot = _submit_plot(
+            _plot_generator().generate_comparison_plot,
             results,
             display_name,
             analysis_method,
@@ -1219,7 +1884,8 @@ def process_external_file_column(file_path, config, data_col_config, df_markers,
 
 def analyze_respiratory_data(manifest, respiratory_configs, comparison_groups, output_folder,
                              batch_mode=False, selected_subjects=None, analysis_method='raw',
-                             plot_type='lineplot', cleaning_enabled=False, cleaning_stages=None):
+                             plot_type='lineplot', cleaning_enabled=False, cleaning_stages=None,
+                             plots_enabled=True):
     """
     Analyze respiratory (Vernier) data files.
     
@@ -1234,132 +1900,160 @@ def analyze_respiratory_data(manifest, respiratory_configs, comparison_groups, o
         plot_type: Type of visualization
         cleaning_enabled: Whether to apply data cleaning
         cleaning_stages: Which cleaning stages to apply
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         Tuple of (results_dict, plots_list)
     """
-    print(f"  Processing respiratory data from {len(respiratory_configs)} subject(s)")
+    logger.info(f"  Processing respiratory data from {len(respiratory_configs)} subject(s)")
     
     all_results = {}
     all_plots = []
+    subjects = []
     
-    # Process each subject's respiratory data
+    # Subjects are processed independently, in worker processes when possible
     for subject, config in respiratory_configs.items():
         if not config.get('selected', True):
-            print(f"  Skipping {subject} (not selected)")
+            logger.info(f"  Skipping {subject} (not selected)")
             continue
         
         # Skip if subject not selected
         if batch_mode and selected_subjects and subject not in selected_subjects:
-            print(f"  Skipping {subject} (not in selected subjects)")
-            continue
-        
-        print(f"\n  Subject: {subject}")
-        
-        # Load event markers for this subject
-        df_markers = load_event_markers_for_subject(manifest, subject, batch_mode)
-        if df_markers is None:
-            print(f"    No event markers found - skipping")
+            logger.info(f"  Skipping {subject} (not in selected subjects)")
             continue
         
-        # Find respiratory file for this subject
-        resp_file = find_respiratory_file_for_subject(manifest, subject)
-        if not resp_file:
-            print(f"    No respiratory file found - skipping")
-            continue
-        
-        print(f"    Loading: {os.path.basename(resp_file)}")
-        
-        # Load respiratory data
-        df_resp = pd.read_csv(resp_file)
-        
-        # Detect header format (old vs new)
-        has_new_format = 'timestamp_unix' in df_resp.columns
-        
-        if has_new_format:
-            print(f"    Detected new header format")
-            # New format already has proper timestamps
-            if 'timestamp_unix' in df_resp.columns:
-                df_resp['LocalTimestamp'] = df_resp['timestamp_unix']
-            elif 'timestamp' in df_resp.columns:
-                # Need to parse ISO timestamp
-                df_resp['LocalTimestamp'] = pd.to_datetime(df_resp['timestamp']).apply(lambda x: x.timestamp())
-        else:
-            print(f"    Detected old header format")
-            # Old format: convert timestamp to unix
-            if 'timestamp' in df_resp.columns:
-                # Check if already numeric (unix) or string (ISO)
-                if pd.api.types.is_numeric_dtype(df_resp['timestamp']):
-                    df_resp['LocalTimestamp'] = df_resp['timestamp']
-                else:
-                    df_resp['LocalTimestamp'] = pd.to_datetime(df_resp['timestamp']).apply(lambda x: x.timestamp())
-        
-        # Calculate timestamp offset
-        offset = find_timestamp_offset(df_markers, df_resp)
-        
-        # Analyze RR if selected
-        if config.get('analyzeRR', True) and 'RR' in df_resp.columns:
-            print(f"\n    Analyzing RR (Respiratory Rate)")
-            try:
-                results, plots = analyze_respiratory_metric(
-                    df_resp,
-                    'RR',
-                    df_markers,
-                    offset,
-                    comparison_groups,
-                    analysis_method,
-                    plot_type,
-                    output_folder,
-                    subject_label=subject,
-                    cleaning_enabled=cleaning_enabled,
-                    cleaning_stages=cleaning_stages
-                )
-                
-                if results:
-                    for group_label, stats in results.items():
-                        composite_label = f"{subject} - RR - {group_label}"
-                        all_results[composite_label] = stats
+        subjects.append(subject)
+    
+    subject_outputs = _map_subjects(
+        _analyze_respiratory_subject,
+        subjects,
+        manifest,
+        respiratory_configs,
+        comparison_groups,
+        output_folder,
+        batch_mode=batch_mode,
+        analysis_method=analysis_method,
+        plot_type=plot_type,
+        cleaning_enabled=cleaning_enabled,
+        cleaning_stages=cleaning_stages,
+        plots_enabled=plots_enabled
+    )
+    for subject_results, subject_plots in subject_outputs:
+        all_results.update(subject_results)
+        all_plots.extend(subject_plots)
+    
+    logger.info(f"\n  Respiratory data analysis complete: {len(all_results)} metrics processed")
+    return all_results, all_plots
+
+
+def _analyze_respiratory_subject(subject, manifest, respiratory_configs, comparison_groups, output_folder,
+                                 batch_mode=False, analysis_method='raw', plot_type='lineplot',
+                                 cleaning_enabled=False, cleaning_stages=None, plots_enabled=True):
+    """
+    Respiratory worker: analyze RR and force for one subject. Kept at
+    module level so it can run in a worker process.
+    
+    Returns:
+        Tuple of (results_dict, plots_list) for this subject
+    """
+    config = respiratory_configs[subject]
+    subject_results = {}
+    subject_plots = []
+    
+    logger.info(f"\n  Subject: {subject}")
+    
+    # Load event markers for this subject
+    df_markers = load_event_markers_for_subject(manifest, subject, batch_mode)
+    if df_markers is None:
+        logger.info(f"    No event markers found - skipping")
+        return subject_results, subject_plots
+    
+    # Find respiratory file for this subject
+    resp_file = find_respiratory_file_for_subject(manifest, subject)
+    if not resp_file:
+        logger.info(f"    No respiratory file found - skipping")
+        return subject_results, subject_plots
+    
+    logger.info(f"    Loading: {os.path.basename(resp_file)}")
+    
+    # Load respiratory data - only the timestamp and metric columns are parsed
+    df_resp = pd.read_csv(resp_file, usecols=lambda col: col in RESPIRATORY_COLUMNS)
+    
+    # Detect header format (old vs new)
+    has_new_format = 'timestamp_unix' in df_resp.columns
+    
+    # New format has unix timestamps; old format has 'timestamp' as
+    # either unix seconds or ISO strings
+    logger.info(f"    Detected {'new' if has_new_format else 'old'} header format")
+    timestamp_source = 'timestamp_unix' if has_new_format else 'timestamp'
+    if timestamp_source in df_resp.columns:
+        df_resp['LocalTimestamp'] = _to_unix_seconds(df_resp[timestamp_source])
+    
+    # Calculate timestamp offset
+    offset = find_timestamp_offset(df_markers, df_resp)
+    
+    # Analyze RR if selected
+    if config.get('analyzeRR', True) and 'RR' in df_resp.columns:
+        logger.info(f"\n    Analyzing RR (Respiratory Rate)")
+        try:
+            results, plots = analyze_respiratory_metric(
+                df_resp,
+                'RR',
+                df_markers,
+                offset,
+                comparison_groups,
+                analysis_method,
+                plot_type,
+                output_folder,
+                subject_label=subject,
+                cleaning_enabled=cleaning_enabled,
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
+            )
+            
+            if results:
+                for group_label, stats in results.items():
+                    composite_label = f"{subject} - RR - {group_label}"
+                    subject_results[composite_label] = stats
+            
+            if plots:
+                subject_plots.extend(plots)
+            else:
+                logger.info(f"      No plots generated for RR (likely due to sparse data)")
                 
-                if plots:
-                    all_plots.extend(plots)
-                else:
-                    print(f"      No plots generated for RR (likely due to sparse data)")
-                    
-            except Exception as e:
-                print(f"      Error analyzing RR: {e}")
-                import traceback
-                traceback.print_exc()
-        
-        # Analyze Force if selected
-        if config.get('analyzeForce', True) and 'force' in df_resp.columns:
-            print(f"\n    Analyzing Force (Respiratory Effort)")
-            try:
-                results, plots = analyze_respiratory_metric(
-                    df_resp,
-                    'force',
-                    df_markers,
-                    offset,
-                    comparison_groups,
-                    analysis_method,
-                    plot_type,
-                    output_folder,
-                    subject_label=subject,
-                    cleaning_enabled=cleaning_enabled,
-                    cleaning_stages=cleaning_stages
-                )
+        except Exception as e:
+            logger.exception(f"      Error analyzing RR: {e}")
+    
+    # Analyze Force if selected
+    if config.get('analyzeForce', True) and 'force' in df_resp.columns:
+        logger.info(f"\n    Analyzing Force (Respiratory Effort)")
+        try:
+            results, plots = analyze_respiratory_metric(
+                df_resp,
+                'force',
+                df_markers,
+                offset,
+                comparison_groups,
+                analysis_method,
+                plot_type,
+                output_folder,
+                subject_label=subject,
+                cleaning_enabled=cleaning_enabled,
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
+            )
+            
+            if results:
+                for group_label, stats in results.items():
+                    composite_label = f"{subject} - Force - {group_label}"
+                    subject_results[composite_label] = stats
+            if plots:
+                subject_plots.extend(plots)
                 
-                if results:
-                    for group_label, stats in results.items():
-                        composite_label = f"{subject} - Force - {group_label}"
-                        all_results[composite_label] = stats
-                if plots:
-                    all_plots.extend(plots)
-                    
-            except Exception as e:
-                print(f"      Error analyzing Force: {e}")
+        except Exception as e:
+            logger.error(f"      Error analyzing Force: {e}")
     
-    print(f"\n  Respiratory data analysis complete: {len(all_results)} metrics processed")
-    return all_results, all_plots
+    return subject_results, subject_plots
 
 
 def find_respiratory_file_for_subject(manifest, subject):
@@ -1373,7 +2067,8 @@ def find_respiratory_file_for_subject(manifest, subject):
 
 def analyze_respiratory_metric(df_resp, metric_col, df_markers, offset, comparison_groups,
                                analysis_method, plot_type, output_folder, subject_label='',
-                               cleaning_enabled=False, cleaning_stages=None):
+                               cleaning_enabled=False, cleaning_stages=None,
+                               plots_enabled=True):
     """
     Analyze a single respiratory metric (RR or force).
     
@@ -1389,71 +2084,55 @@ def analyze_respiratory_metric(df_resp, metric_col, df_markers, offset, comparis
         subject_label: Subject identifier
         cleaning_enabled: Whether to clean data
         cleaning_stages: Cleaning stages to apply
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         Tuple of (results_dict, plots_list)
     """
-    df_processed = pd.DataFrame({
-        'LocalTimestamp': df_resp['LocalTimestamp'],
-        metric_col: df_resp[metric_col]
-    })
+    # Only the timestamp and the analyzed metric are carried forward
+    df_processed = df_resp[['LocalTimestamp', metric_col]]
 
     # Check data sparsity for RR (which is typically measured per breath cycle)
-    non_null_count = df_processed[metric_col].notna().sum()
+    valid_mask = df_processed[metric_col].notna()
+    non_null_count = int(valid_mask.sum())
     total_count = len(df_processed)
     sparsity_ratio = non_null_count / total_count if total_count > 0 else 0
 
-    print(f"        Data sparsity: {non_null_count}/{total_count} ({sparsity_ratio*100:.1f}% non-null)")
+    logger.info(f"        Data sparsity: {non_null_count}/{total_count} ({sparsity_ratio*100:.1f}% non-null)")
 
     if sparsity_ratio < 0.1:
-        print(f"        WARNING: Very sparse data for {metric_col} (<10% non-null values)")
-        print(f"        This may affect analysis quality")
+        logger.warning(f"        Very sparse data for {metric_col} (<10% non-null values)")
+        logger.info(f"        This may affect analysis quality")
 
    # Apply data cleaning if enabled
     if cleaning_enabled:
-        from DataCleaner import BiometricDataCleaner
-        
-        # Check if metric is sparse (common for RR which is per-breath, not per-sample)
-        non_null_count = df_processed[metric_col].notna().sum()
-        total_count = len(df_processed)
-        sparsity_ratio = non_null_count / total_count if total_count > 0 else 0
-        
-        print(f"        Data density: {non_null_count}/{total_count} ({sparsity_ratio*100:.1f}% non-null)")
-        
+        # Sparse metrics are common for RR, which is per-breath, not per-sample
         if sparsity_ratio < 0.5:  # If more than 50% sparse
-            print(f"        Detected sparse metric - cleaning only non-null values without removing rows")
+            logger.info(f"        Detected sparse metric - cleaning only non-null values without removing rows")
             
             # For sparse metrics, only clean the non-null values
-            # Create a mask for non-null values
-            valid_mask = df_processed[metric_col].notna()
-            
-            if valid_mask.sum() > 0:
-                # Extract only non-null rows for cleaning
-                df_to_clean = df_processed[valid_mask].copy()
+            if non_null_count > 0:
+                # Clean only the valid values, straight from the column arrays
+                values = df_processed.loc[valid_mask, metric_col].to_numpy()
+                timestamps = df_processed.loc[valid_mask, 'LocalTimestamp'].to_numpy()
                 
                 metric_type = 'RR' if metric_col == 'RR' else 'default'
-                cleaner = BiometricDataCleaner(metric_type=metric_type)
-                
-                # Clean only the valid data
-                df_cleaned = cleaner.clean(
-                    df_to_clean,
-                    metric_col,
-                    timestamp_col='LocalTimestamp',
-                    stages=cleaning_stages
-                )
+                cleaner = _get_cleaner(metric_type)
+                cleaned = cleaner.clean_arrays(values, timestamps, stages=cleaning_stages)
                 
-                # Merge cleaned values back into original dataframe structure
+                # Write cleaned values back in place; removed samples become NaN
                 # This preserves the timeline with NaN values intact
-                df_processed.loc[valid_mask, metric_col] = df_cleaned[metric_col].values
+                df_processed = df_processed.copy()
+                df_processed.loc[valid_mask, metric_col] = cleaned
                 
-                print(f"        Cleaned {len(df_cleaned)}/{non_null_count} non-null values")
+                logger.info(f"        Cleaned {np.count_nonzero(~np.isnan(cleaned))}/{non_null_count} non-null values")
             else:
-                print(f"        No non-null values to clean")
+                logger.info(f"        No non-null values to clean")
         else:
             # Continuous data - clean normally
-            print(f"        Continuous metric - applying standard cleaning")
+            logger.info(f"        Continuous metric - applying standard cleaning")
             metric_type = 'RR' if metric_col == 'RR' else 'default'
-            cleaner = BiometricDataCleaner(metric_type=metric_type)
+            cleaner = _get_cleaner(metric_type)
             df_processed = cleaner.clean(
                 df_processed,
                 metric_col,
@@ -1464,39 +2143,32 @@ def analyze_respiratory_metric(df_resp, metric_col, df_markers, offset, comparis
     # Check if we have any valid data after cleaning
     valid_data_count = df_processed[metric_col].notna().sum()
     if valid_data_count == 0:
-        print(f"        WARNING: No valid data available after cleaning")
+        logger.warning(f"        No valid data available after cleaning")
         return None, []
     
     # Extract data for each comparison group
     group_data_raw = {}
     
-    for group in comparison_groups:
+    windows = extract_windows_batch(df_processed, df_markers, offset, comparison_groups)
+    for group, data in zip(comparison_groups, windows):
         group_label = group['label']
-        data = extract_window_data(df_processed, df_markers, offset, group)
         
         if len(data) > 0:
             group_data_raw[group_label] = data
-            print(f"        {group_label}: {len(data)} points")
+            logger.info(f"        {group_label}: {len(data)} points")
     
     if len(group_data_raw) == 0:
-        print(f"        No data extracted for any event")
+        logger.info(f"        No data extracted for any event")
         return None, []
     
-    # Apply analysis method
-    group_data_processed = {}
-    for group_label, data in group_data_raw.items():
-        try:
-            processed = apply_analysis_method(data, metric_col, analysis_method)
-            group_data_processed[group_label] = processed
-        except Exception as e:
-            print(f"        Error processing {group_label}: {e}")
-            continue
+    # Apply analysis method - one grouped pass over all windows
+    group_data_processed = apply_group_analysis_method(group_data_raw, metric_col, analysis_method)
     
-    # Calculate statistics
-    results = {}
-    for group_label, data in group_data_processed.items():
-        stats = calculate_statistics(data, metric_col, analysis_method)
-        results[group_label] = stats
+    # Calculate statistics for all groups in one grouped pass
+    results = calculate_group_statistics(group_data_processed, metric_col, analysis_method)
+    
+    if not plots_enabled:
+        return results, []
     
     # Generate plots
     plots = []
@@ -1508,7 +2180,8 @@ def analyze_respiratory_metric(df_resp, metric_col, df_markers, offset, comparis
     # Main plot
     if plot_type != 'barchart':
         suffix = f"_resp_{subject_label}_{metric_col}"
-        plot = generate_plot(
+        plot = _submit_plot(
+            _plot_generator().generate_plot,
             group_data_processed,
             metric_col,
             metric_name,  # ✅ Use clean name for filename: 'RR' or 'Force'
@@ -1524,7 +2197,8 @@ def analyze_respiratory_metric(df_resp, metric_col, df_markers, offset, comparis
     # Comparison plot
     if len(group_data_processed) >= 2:
         suffix = f"_resp_{subject_label}_{metric_col}"
-        comp_plot = generate_comparison_plot(
+        comp_plot = _submit_plot(
+            _plot_generator().generate_comparison_plot,
             results,
             metric_name,
             analysis_method,
@@ -1539,7 +2213,8 @@ def analyze_respiratory_metric(df_resp, metric_col, df_markers, offset, comparis
 
 def analyze_cardiac_data(manifest, cardiac_configs, comparison_groups, output_folder,
                         batch_mode=False, selected_subjects=None, analysis_method='raw',
-                        plot_type='lineplot', cleaning_enabled=False, cleaning_stages=None):
+                        plot_type='lineplot', cleaning_enabled=False, cleaning_stages=None,
+                        plots_enabled=True):
     """
     Analyze cardiac (Polar H10) data files.
     
@@ -1554,117 +2229,163 @@ def analyze_cardiac_data(manifest, cardiac_configs, comparison_groups, output_fo
         plot_type: Type of visualization
         cleaning_enabled: Whether to apply data cleaning
         cleaning_stages: Which cleaning stages to apply
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         Tuple of (results_dict, plots_list)
     """
-    print(f"  Processing cardiac data from {len(cardiac_configs)} subject(s)")
+    logger.info(f"  Processing cardiac data from {len(cardiac_configs)} subject(s)")
     
     all_results = {}
     all_plots = []
+    subjects = []
     
-    # Process each subject's cardiac data
+    # Subjects are processed independently, in worker processes when possible
     for subject, config in cardiac_configs.items():
         if not config.get('selected', True):
-            print(f"  Skipping {subject} (not selected)")
+            logger.info(f"  Skipping {subject} (not selected)")
             continue
         
         # Skip if subject not selected
         if batch_mode and selected_subjects and subject not in selected_subjects:
-            print(f"  Skipping {subject} (not in selected subjects)")
-            continue
-        
-        print(f"\n  Subject: {subject}")
-        
-        # Load event markers for this subject
-        df_markers = load_event_markers_for_subject(manifest, subject, batch_mode)
-        if df_markers is None:
-            print(f"    No event markers found - skipping")
+            logger.info(f"  Skipping {subject} (not in selected subjects)")
             continue
         
-        # Find cardiac file for this subject
+        subjects.append(subject)
+    
+    # Cardiac frames are parsed here, in the parent process, so the CSV cache
+    # outlives the worker processes and reruns on unchanged files reuse it
+    subject_frames = {}
+    for subject in subjects:
         cardiac_file = find_cardiac_file_for_subject(manifest, subject)
-        if not cardiac_file:
-            print(f"    No cardiac file found - skipping")
-            continue
-        
-        print(f"    Loading: {os.path.basename(cardiac_file)}")
-        
-        # Load cardiac data
-        df_cardiac = pd.read_csv(cardiac_file)
-        
-        # Cardiac files already have timestamp_unix column
-        if 'timestamp_unix' in df_cardiac.columns:
-            df_cardiac['LocalTimestamp'] = df_cardiac['timestamp_unix']
-        elif 'timestamp' in df_cardiac.columns:
-            # Fallback: parse ISO timestamp
-            df_cardiac['LocalTimestamp'] = pd.to_datetime(df_cardiac['timestamp']).apply(lambda x: x.timestamp())
-        else:
-            print(f"    ERROR: No timestamp column found - skipping")
-            continue
-        
-        # Calculate timestamp offset
-        offset = find_timestamp_offset(df_markers, df_cardiac)
-        
-        # Analyze HR if selected
-        if config.get('analyzeHR', True) and 'HR' in df_cardiac.columns:
-            print(f"\n    Analyzing HR (Heart Rate)")
-            try:
-                results, plots = analyze_cardiac_metric(
-                    df_cardiac,
-                    'HR',
-                    df_markers,
-                    offset,
-                    comparison_groups,
-                    analysis_method,
-                    plot_type,
-                    output_folder,
-                    subject_label=subject,
-                    cleaning_enabled=cleaning_enabled,
-                    cleaning_stages=cleaning_stages
-                )
-                
-                if results:
-                    for group_label, stats in results.items():
-                        composite_label = f"{subject} - HR - {group_label}"
-                        all_results[composite_label] = stats
+        if cardiac_file:
+            subject_frames[subject] = {'df_cardiac': _load_cardiac_cached(cardiac_file)}
+    
+    subject_outputs = _map_subjects(
+        _analyze_cardiac_subject,
+        subjects,
+        manifest,
+        cardiac_configs,
+        comparison_groups,
+        output_folder,
+        subject_kwargs=subject_frames,
+        batch_mode=batch_mode,
+        analysis_method=analysis_method,
+        plot_type=plot_type,
+        cleaning_enabled=cleaning_enabled,
+        cleaning_stages=cleaning_stages,
+        plots_enabled=plots_enabled
+    )
+    for subject_results, subject_plots in subject_outputs:
+        all_results.update(subject_results)
+        all_plots.extend(subject_plots)
+    
+    logger.info(f"\n  Cardiac data analysis complete: {len(all_results)} metrics processed")
+    return all_results, all_plots
 
-                # Always add plots if they exist, regardless of results
-                if plots:
-                    all_plots.extend(plots)
-                    
-            except Exception as e:
-                print(f"      Error analyzing HR: {e}")
-        
-        # Analyze HRV if selected
-        if config.get('analyzeHRV', True) and 'HRV' in df_cardiac.columns:
-            print(f"\n    Analyzing HRV (Heart Rate Variability)")
-            try:
-                results, plots = analyze_cardiac_metric(
-                    df_cardiac,
-                    'HRV',
-                    df_markers,
-                    offset,
-                    comparison_groups,
-                    analysis_method,
-                    plot_type,
-                    output_folder,
-                    subject_label=subject,
-                    cleaning_enabled=cleaning_enabled,
-                    cleaning_stages=cleaning_stages
-                )
+
+def _analyze_cardiac_subject(subject, manifest, cardiac_configs, comparison_groups, output_folder,
+                             batch_mode=False, analysis_method='raw', plot_type='lineplot',
+                             cleaning_enabled=False, cleaning_stages=None, plots_enabled=True,
+                             df_cardiac=None):
+    """
+    Cardiac worker: analyze HR and HRV for one subject. Kept at module
+    level so it can run in a worker process. df_cardiac is the subject's
+    frame from _load_cardiac_cached(), loaded here if not given.
+    
+    Returns:
+        Tuple of (results_dict, plots_list) for this subject
+    """
+    config = cardiac_configs[subject]
+    subject_results = {}
+    subject_plots = []
+    
+    logger.info(f"\n  Subject: {subject}")
+    
+    # Load event markers for this subject
+    df_markers = load_event_markers_for_subject(manifest, subject, batch_mode)
+    if df_markers is None:
+        logger.info(f"    No event markers found - skipping")
+        return subject_results, subject_plots
+    
+    # Find cardiac file for this subject
+    cardiac_file = find_cardiac_file_for_subject(manifest, subject)
+    if not cardiac_file:
+        logger.info(f"    No cardiac file found - skipping")
+        return subject_results, subject_plots
+    
+    logger.info(f"    Loading: {os.path.basename(cardiac_file)}")
+    
+    # Load cardiac data, shared through the cardiac CSV cache
+    if df_cardiac is None:
+        df_cardiac = _load_cardiac_cached(cardiac_file)
+    if df_cardiac is None:
+        logger.error(f"    No timestamp column found - skipping")
+        return subject_results, subject_plots
+    
+    # Calculate timestamp offset
+    offset = find_timestamp_offset(df_markers, df_cardiac)
+    
+    # Analyze HR if selected
+    if config.get('analyzeHR', True) and 'HR' in df_cardiac.columns:
+        logger.info(f"\n    Analyzing HR (Heart Rate)")
+        try:
+            results, plots = analyze_cardiac_metric(
+                df_cardiac,
+                'HR',
+                df_markers,
+                offset,
+                comparison_groups,
+                analysis_method,
+                plot_type,
+                output_folder,
+                subject_label=subject,
+                cleaning_enabled=cleaning_enabled,
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
+            )
+            
+            if results:
+                for group_label, stats in results.items():
+                    composite_label = f"{subject} - HR - {group_label}"
+                    subject_results[composite_label] = stats
+
+            # Always add plots if they exist, regardless of results
+            if plots:
+                subject_plots.extend(plots)
                 
-                if results:
-                    for group_label, stats in results.items():
-                        composite_label = f"{subject} - HRV - {group_label}"
-                        all_results[composite_label] = stats
-                    all_plots.extend(plots)
-                    
-            except Exception as e:
-                print(f"      Error analyzing HRV: {e}")
+        except Exception as e:
+            logger.error(f"      Error analyzing HR: {e}")
     
-    print(f"\n  Cardiac data analysis complete: {len(all_results)} metrics processed")
-    return all_results, all_plots
+    # Analyze HRV if selected
+    if config.get('analyzeHRV', True) and 'HRV' in df_cardiac.columns:
+        logger.info(f"\n    Analyzing HRV (Heart Rate Variability)")
+        try:
+            results, plots = analyze_cardiac_metric(
+                df_cardiac,
+                'HRV',
+                df_markers,
+                offset,
+                comparison_groups,
+                analysis_method,
+                plot_type,
+                output_folder,
+                subject_label=subject,
+                cleaning_enabled=cleaning_enabled,
+                cleaning_stages=cleaning_stages,
+                plots_enabled=plots_enabled
+            )
+            
+            if results:
+                for group_label, stats in results.items():
+                    composite_label = f"{subject} - HRV - {group_label}"
+                    subject_results[composite_label] = stats
+                subject_plots.extend(plots)
+                
+        except Exception as e:
+            logger.error(f"      Error analyzing HRV: {e}")
+    
+    return subject_results, subject_plots
 
 
 def find_cardiac_file_for_subject(manifest, subject):
@@ -1678,7 +2399,8 @@ def find_cardiac_file_for_subject(manifest, subject):
 
 def analyze_cardiac_metric(df_cardiac, metric_col, df_markers, offset, comparison_groups,
                            analysis_method, plot_type, output_folder, subject_label='',
-                           cleaning_enabled=False, cleaning_stages=None):
+                           cleaning_enabled=False, cleaning_stages=None,
+                           plots_enabled=True):
     """
     Analyze a single cardiac metric (HR or HRV).
     
@@ -1697,63 +2419,59 @@ def analyze_cardiac_metric(df_cardiac, metric_col, df_markers, offset, compariso
         subject_label: Subject identifier
         cleaning_enabled: Whether to clean data
         cleaning_stages: Cleaning stages to apply
+        plots_enabled: Whether to render plots; False returns statistics only
         
     Returns:
         Tuple of (results_dict, plots_list)
     """
-    # Create standardized structure
-    df_processed = pd.DataFrame({
-        'LocalTimestamp': df_cardiac['LocalTimestamp'],
-        metric_col: df_cardiac[metric_col]
-    })
+    # Only the timestamp and the analyzed metric are carried forward
+    df_processed = df_cardiac[['LocalTimestamp', metric_col]]
     
     # Apply data cleaning if enabled
     if cleaning_enabled:
-        from DataCleaner import BiometricDataCleaner
         # Both HR and HRV use HR-type cleaning (physiological ranges)
         metric_type = 'HR'
-        cleaner = BiometricDataCleaner(metric_type=metric_type)
-        df_processed = cleaner.clean(
-            df_processed,
-            metric_col,
-            timestamp_col='LocalTimestamp',
+        cleaner = _get_cleaner(metric_type)
+        timestamps = df_processed['LocalTimestamp'].to_numpy()
+        cleaned = cleaner.clean_arrays(
+            df_processed[metric_col].to_numpy(),
+            timestamps,
             stages=cleaning_stages
         )
+        # Removed samples come back as NaN; only the kept rows are framed
+        kept = ~np.isnan(cleaned)
+        df_processed = pd.DataFrame({
+            'LocalTimestamp': timestamps[kept],
+            metric_col: cleaned[kept]
+        })
     
     if len(df_processed) == 0:
-        print(f"        WARNING: All data removed during cleaning")
+        logger.warning(f"        All data removed during cleaning")
         return None, []
     
     # Extract data for each comparison group
     group_data_raw = {}
     
-    for group in comparison_groups:
+    windows = extract_windows_batch(df_processed, df_markers, offset, comparison_groups)
+    for group, data in zip(comparison_groups, windows):
         group_label = group['label']
-        data = extract_window_data(df_processed, df_markers, offset, group)
         
         if len(data) > 0:
             group_data_raw[group_label] = data
-            print(f"        {group_label}: {len(data)} points")
+            logger.info(f"        {group_label}: {len(data)} points")
     
     if len(group_data_raw) == 0:
-        print(f"        No data extracted for any event")
+        logger.info(f"        No data extracted for any event")
         return None, []
     
-    # Apply analysis method
-    group_data_processed = {}
-    for group_label, data in group_data_raw.items():
-        try:
-            processed = apply_analysis_method(data, metric_col, analysis_method)
-            group_data_processed[group_label] = processed
-        except Exception as e:
-            print(f"        Error processing {group_label}: {e}")
-            continue
+    # Apply analysis method - one grouped pass over all windows
+    group_data_processed = apply_group_analysis_method(group_data_raw, metric_col, analysis_method)
     
-    # Calculate statistics
-    results = {}
-    for group_label, data in group_data_processed.items():
-        stats = calculate_statistics(data, metric_col, analysis_method)
-        results[group_label] = stats
+    # Calculate statistics for all groups in one grouped pass
+    results = calculate_group_statistics(group_data_processed, metric_col, analysis_method)
+    
+    if not plots_enabled:
+        return results, []
     
     # Generate plots
     plots = []
@@ -1764,7 +2482,8 @@ def analyze_cardiac_metric(df_cardiac, metric_col, df_markers, offset, compariso
     # Main plot
     if plot_type != 'barchart':
         suffix = f"_cardiac_{subject_label}_{metric_col}"
-        plot = generate_plot(
+        plot = _submit_plot(
+            _plot_generator().generate_plot,
             group_data_processed,
             metric_col,
             metric_name,
@@ -1780,7 +2499,8 @@ def analyze_cardiac_metric(df_cardiac, metric_col, df_markers, offset, compariso
     # Comparison plot
     if len(group_data_processed) >= 2:
         suffix = f"_cardiac_{subject_label}_{metric_col}"
-        comp_plot = generate_comparison_plot(
+        comp_plot = _submit_plot(
+            _plot_generator().generate_comparison_plot,
             results,
             metric_name,
             analysis_method,
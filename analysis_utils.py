@@ -37,9 +37,9 @@ ARCHITECTURE OVERVIEW:
     │    [Point-wise event matching]
     │    Output: Closest biometric sample per event
     │
-    └──► extract_window_data()
+    └──► extract_window_data() / extract_windows_batch()
          [Window-based extraction]
-         Input: EmotiBit data + Event config + Offset
+         Input: EmotiBit data + Event config(s) + Offset
          Output: Data windows around events
 
 FUNCTION CONTRACT - prepare_event_markers_timestamps():
@@ -263,13 +263,15 @@ Condition Filtering:
     Use case: Analyzing only "difficult" trials or "stress" conditions
 
 Processing Steps:
-    1. Apply offset: emotibit_df['AdjustedTimestamp'] = LocalTimestamp + offset
+    1. Apply offset: AdjustedTimestamp = LocalTimestamp + offset
     2. Filter events by marker name and optional condition
     3. For each matching event:
         a. Determine window boundaries (full or custom)
-        b. Extract emotibit rows within window
-        c. Append to collection
-    4. Concatenate all windows (ignore_index=True)
+        b. Locate the rows within the window with np.searchsorted
+           (stable argsort first if LocalTimestamp is not monotonic)
+        c. Append their row positions to collection
+    4. Take all collected rows in one pass (fresh 0..n-1 index),
+       with 'AdjustedTimestamp' as the last column
     5. Log extraction statistics
 
 Example Configurations:
@@ -325,6 +327,28 @@ Example Usage:
     >>> baseline_data = extract_window_data(df_hr, df_events, offset, baseline_config)
     >>> print(f"Baseline HR: {baseline_data['HR'].mean():.1f} bpm")
 
+FUNCTION CONTRACT - extract_windows_batch():
+============================================
+
+Purpose: Extract the windows of several comparison groups from one recording
+
+Input Requirements:
+    - emotibit_df, event_markers_df, offset: as for extract_window_data()
+    - window_configs: list of window_config dicts (see extract_window_data)
+
+Output:
+    list of DataFrames, one per window_config, in the same order; each is
+    identical to extract_window_data(emotibit_df, event_markers_df, offset, config)
+
+Notes:
+    - The offset is applied, and the timestamps sorted if not monotonic,
+      once for all groups instead of once per group
+    - extract_window_data() is the single-config case of this function
+
+Example Usage:
+    >>> windows = extract_windows_batch(df_hr, df_events, offset, comparison_groups)
+    >>> group_data = {g['label']: d for g, d in zip(comparison_groups, windows) if len(d) > 0}
+
 FUNCTION CONTRACT - get_subject_files():
 ========================================
 
@@ -428,6 +452,49 @@ Example Usage:
     ... else:
     ...     print("Heart rate data not available")
 
+FUNCTION CONTRACT - read_metric_csv():
+======================================
+
+Purpose: Parse an EmotiBit metric CSV as fast as the installed libraries allow
+
+Input Requirements:
+    - path: str, metric CSV file (numeric columns plus 'LocalTimestamp')
+
+Output:
+    DataFrame with only 'LocalTimestamp' and the metric column (both float64,
+    the metric still the last column); all columns if either is missing or
+    the metric column is not numeric
+
+Engine Selection:
+    - pyarrow installed: multi-threaded Arrow CSV reader (engine='pyarrow')
+    - otherwise, or if Arrow rejects the file: pandas C parser
+    - Event marker files are NOT read with this helper - Arrow converts ISO
+      timestamp strings to datetimes, which prepare_event_markers_timestamps
+      does not expect
+
+FUNCTION CONTRACT - read_csv_files_concurrently():
+==================================================
+
+Purpose: Load several CSV files at once so per-file disk latency overlaps
+
+Input Requirements:
+    - paths: list of CSV file paths (duplicates are read once)
+    - max_workers: int | None, thread count (default: min(8, number of files))
+    - reader: callable(path) -> DataFrame (default: pd.read_csv)
+
+Output:
+    dict {path: DataFrame}, same content as pd.read_csv(path)
+
+Notes:
+    - Threads, not processes: the C parser releases the GIL while reading,
+      and frames come back without pickling
+    - Read errors propagate to the caller, as with pd.read_csv
+
+Example Usage:
+    >>> paths = [find_metric_file_for_subject(get_subject_files(manifest, s), 'HR')
+    ...          for s in subjects]
+    >>> frames = read_csv_files_concurrently([p for p in paths if p], reader=read_metric_csv)
+
 TIMESTAMP SYNCHRONIZATION DEEP DIVE:
 ====================================
 
@@ -622,7 +689,17 @@ REQUIRES: pandas>=1.0, numpy>=1.18
 
 import pandas as pd
 import numpy as np
+import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow  # noqa: F401 - optional, enables the multi-threaded CSV reader
+    _METRIC_CSV_ENGINE = 'pyarrow'
+except ImportError:
+    _METRIC_CSV_ENGINE = 'c'
+
+logger = logging.getLogger(__name__)
 
 def prepare_event_markers_timestamps(df):
     """
@@ -648,7 +725,7 @@ def prepare_event_markers_timestamps(df):
     # NEW STRUCTURE: Check for timestamp_unix column
     # ═══════════════════════════════════════════════════════════
     if 'timestamp_unix' in df.columns:
-        print(f"Found 'timestamp_unix' column (NEW format)")
+        logger.info(f"Found 'timestamp_unix' column (NEW format)")
         df['unix_timestamp'] = df['timestamp_unix']
         
         # Drop invalid timestamps
@@ -658,9 +735,9 @@ def prepare_event_markers_timestamps(df):
         after_count = len(df)
         
         if before_count > after_count:
-            print(f"Dropped {before_count - after_count} rows with invalid timestamps")
+            logger.warning(f"Dropped {before_count - after_count} rows with invalid timestamps")
         
-        print(f"Using {after_count} valid unix timestamps")
+        logger.info(f"Using {after_count} valid unix timestamps")
         return df
     
     # ═══════════════════════════════════════════════════════════
@@ -678,11 +755,11 @@ def prepare_event_markers_timestamps(df):
     # Try to detect format
     if isinstance(sample_timestamp, (int, float)):
         # Already unix timestamp
-        print(f"Found 'timestamp' column (numeric unix format)")
+        logger.info(f"Found 'timestamp' column (numeric unix format)")
         df['unix_timestamp'] = df['timestamp']
     else:
         # ISO format string - need to convert
-        print(f"Found 'timestamp' column (ISO format) - converting to unix_timestamp")
+        logger.info(f"Found 'timestamp' column (ISO format) - converting to unix_timestamp")
         
         converted_timestamps = []
         invalid_count = 0
@@ -719,9 +796,9 @@ def prepare_event_markers_timestamps(df):
         after_count = len(df)
         
         if invalid_count > 0:
-            print(f"Dropped {invalid_count} rows with invalid timestamps")
+            logger.warning(f"Dropped {invalid_count} rows with invalid timestamps")
         
-        print(f"Converted {after_count} timestamps from ISO to Unix format")
+        logger.info(f"Converted {after_count} timestamps from ISO to Unix format")
     
     return df
 
@@ -744,9 +821,9 @@ def find_timestamp_offset(event_markers_df, emotibit_df):
     
     offset = event_marker_start - emotibit_start
     
-    print(f"Event Marker Start: {datetime.fromtimestamp(event_marker_start)}")
-    print(f"EmotiBit Start: {datetime.fromtimestamp(emotibit_start)}")
-    print(f"Calculated Offset: {offset:.2f}s ({offset/3600:.2f} hours)")
+    logger.info(f"Event Marker Start: {datetime.fromtimestamp(event_marker_start)}")
+    logger.info(f"EmotiBit Start: {datetime.fromtimestamp(emotibit_start)}")
+    logger.info(f"Calculated Offset: {offset:.2f}s ({offset/3600:.2f} hours)")
     
     return offset
 
@@ -792,7 +869,7 @@ def match_event_markers_to_biometric(event_markers_df, emotibit_df, offset, tole
                 'row_index': closest_idx
             })
         else:
-            print(f"WARNING: No match within tolerance for event '{event_marker}' at {event_time}")
+            logger.warning(f"No match within tolerance for event '{event_marker}' at {event_time}")
     
     return matches
 
@@ -801,17 +878,45 @@ def extract_window_data(emotibit_df, event_markers_df, offset, window_config):
     """
     Extract data from emotibit dataframe based on window configuration.
     """
-    emotibit_df = emotibit_df.copy()
-    emotibit_df['AdjustedTimestamp'] = emotibit_df['LocalTimestamp'] + offset
+    return extract_windows_batch(emotibit_df, event_markers_df, offset, [window_config])[0]
+
+def extract_windows_batch(emotibit_df, event_markers_df, offset, window_configs):
+    """
+    Extract data for several window configurations at once. The adjusted
+    timestamps are computed (and sorted, if needed) once and shared by all
+    windows; each result is identical to extract_window_data() for that config.
+    
+    Returns:
+        List of DataFrames, one per entry of window_configs
+    """
+    # Window bounds are found by binary search on the adjusted timestamps
+    # instead of a boolean mask over the whole recording per occurrence.
+    adjusted = emotibit_df['LocalTimestamp'].to_numpy(dtype=np.float64) + offset
+    if emotibit_df['LocalTimestamp'].is_monotonic_increasing:
+        order = None
+        sorted_ts = adjusted
+    else:
+        order = np.argsort(adjusted, kind='stable')  # NaN sorts last, never selected
+        sorted_ts = adjusted[order]
     
+    return [
+        _extract_window(emotibit_df, event_markers_df, adjusted, sorted_ts, order, window_config)
+        for window_config in window_configs
+    ]
+
+def _extract_window(emotibit_df, event_markers_df, adjusted, sorted_ts, order, window_config):
+    """
+    One window of extract_windows_batch(), given the shared adjusted timestamps,
+    their sorted view and the sorting permutation (None if already sorted).
+    """
     event_marker = window_config['eventMarker']
     
     # SPECIAL CASE: "all" means entire experiment duration
     if event_marker == 'all':
-        print(f"Analyzing entire experiment duration")
-        return emotibit_df.copy()
-    
-    metric_col = emotibit_df.columns[-1]
+        logger.debug(f"Analyzing entire experiment duration")
+        emotibit_df = emotibit_df.copy()
+        emotibit_df['AdjustedTimestamp'] = adjusted
+        return emotibit_df
     
     marker_rows = event_markers_df[event_markers_df['event_marker'] == event_marker]
     
@@ -820,55 +925,58 @@ def extract_window_data(emotibit_df, event_markers_df, offset, window_config):
         if 'condition' in event_markers_df.columns:
             marker_rows = marker_rows[marker_rows['condition'] == condition_marker]
         else:
-            print(f"Warning: Condition column not found in event markers")
+            logger.warning(f"Condition column not found in event markers")
     
     if len(marker_rows) == 0:
-        print(f"Warning: No occurrences of event marker '{event_marker}'" + 
-              (f" with condition '{condition_marker}'" if condition_marker else "") + " found")
+        logger.warning(f"No occurrences of event marker '{event_marker}'" + 
+                       (f" with condition '{condition_marker}'" if condition_marker else "") + " found")
         return pd.DataFrame()
     
-    print(f"Found {len(marker_rows)} occurrences of '{event_marker}'" +
-          (f" with condition '{condition_marker}'" if condition_marker else ""))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Found {len(marker_rows)} occurrences of '{event_marker}'" +
+                     (f" with condition '{condition_marker}'" if condition_marker else ""))
     
-    all_data = []
+    if window_config['timeWindowType'] == 'full':
+        all_marker_times = event_markers_df['unix_timestamp'].to_numpy(dtype=np.float64)
+        marker_labels = event_markers_df['event_marker']
+        is_boundary = (marker_labels.notna() & (marker_labels != '')).to_numpy()
+        last_marker_time = event_markers_df['unix_timestamp'].max()
     
-    for idx, marker_row in marker_rows.iterrows():
-        marker_time = marker_row['unix_timestamp']
-        
+    windows = []
+    
+    for marker_time in marker_rows['unix_timestamp'].to_numpy(dtype=np.float64):
         if window_config['timeWindowType'] == 'full':
-            next_markers = event_markers_df[
-                (event_markers_df['unix_timestamp'] > marker_time) &
-                (event_markers_df['event_marker'].notna()) &
-                (event_markers_df['event_marker'] != '')
-            ]
+            # Window ends at the next labelled marker in file order
+            next_markers = np.flatnonzero(is_boundary & (all_marker_times > marker_time))
             
             if len(next_markers) > 0:
-                end_time = next_markers.iloc[0]['unix_timestamp']
+                end_time = all_marker_times[next_markers[0]]
             else:
-                end_time = event_markers_df['unix_timestamp'].max()
+                end_time = last_marker_time
             
-            window_data = emotibit_df[
-                (emotibit_df['AdjustedTimestamp'] >= marker_time) &
-                (emotibit_df['AdjustedTimestamp'] < end_time)
-            ].copy()
+            lo = np.searchsorted(sorted_ts, marker_time, side='left')
+            hi = np.searchsorted(sorted_ts, end_time, side='left')
             
         else:  # custom time window
             start_offset = window_config['customStart']
             end_offset = window_config['customEnd']
             
-            window_data = emotibit_df[
-                (emotibit_df['AdjustedTimestamp'] >= marker_time + start_offset) &
-                (emotibit_df['AdjustedTimestamp'] <= marker_time + end_offset)
-            ].copy()
+            lo = np.searchsorted(sorted_ts, marker_time + start_offset, side='left')
+            hi = np.searchsorted(sorted_ts, marker_time + end_offset, side='right')
         
-        if len(window_data) > 0:
-            all_data.append(window_data)
+        if hi > lo:
+            if order is None:
+                windows.append(np.arange(lo, hi))
+            else:
+                windows.append(np.sort(order[lo:hi]))
     
-    if len(all_data) == 0:
+    if len(windows) == 0:
         return pd.DataFrame()
     
-    combined_data = pd.concat(all_data, ignore_index=True)
-    print(f"Extracted {len(combined_data)} data points across all occurrences")
+    positions = np.concatenate(windows)
+    combined_data = emotibit_df.take(positions).reset_index(drop=True)
+    combined_data['AdjustedTimestamp'] = adjusted[positions]
+    logger.debug(f"Extracted {len(combined_data)} data points across all occurrences")
     
     return combined_data
 
@@ -890,13 +998,13 @@ def get_subject_files(manifest, subject_name):
     if 'event_markers_by_subject' in manifest:
         subject_files['event_markers'] = manifest['event_markers_by_subject'].get(subject_name)
         if subject_files['event_markers']:
-            print(f"Found event markers for {subject_name} (batch mode)")
+            logger.debug(f"Found event markers for {subject_name} (batch mode)")
     
     # Priority 2: Check single event markers file (backward compatibility)
     if not subject_files['event_markers'] and manifest.get('event_markers'):
         if subject_name in manifest['event_markers'].get('path', ''):
             subject_files['event_markers'] = manifest['event_markers']
-            print(f"Found event markers for {subject_name} (single subject mode)")
+            logger.debug(f"Found event markers for {subject_name} (single subject mode)")
     
     # Filter respiration files for this subject
     for resp_file in manifest.get('respiration_files', []):
@@ -910,11 +1018,11 @@ def get_subject_files(manifest, subject_name):
             subject_name in external_file.get('path', '')):
             subject_files['external_files'].append(external_file)
     
-    # DEBUG: Log what was found
-    print(f"\nSubject files for {subject_name}:")
-    print(f"- EmotiBit: {len(subject_files['emotibit_files'])} files")
-    print(f"- Event markers: {'✓' if subject_files['event_markers'] else '❌ MISSING'}")
-    print(f"- External data: {len(subject_files['external_files'])} files")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Subject files for {subject_name}: "
+                     f"{len(subject_files['emotibit_files'])} EmotiBit, "
+                     f"event markers {'found' if subject_files['event_markers'] else 'MISSING'}, "
+                     f"{len(subject_files['external_files'])} external")
     
     return subject_files
 
@@ -932,4 +1040,59 @@ def find_metric_file_for_subject(subject_files, metric):
     for emotibit_file in subject_files.get('emotibit_files', []):
         if f'_{metric}.csv' in emotibit_file['filename']:
             return emotibit_file['path']
-    return None
\ No newline at end of file
+    return None
+
+
+def read_metric_csv(path):
+    """
+    Read an EmotiBit metric CSV, using the pyarrow engine when available.
+    
+    Args:
+        path: Path to metric CSV file
+        
+    Returns:
+        DataFrame with 'LocalTimestamp' and the metric column, both float64
+    """
+    # Downstream code only uses LocalTimestamp and the metric (last) column
+    columns = pd.read_csv(path, nrows=0).columns
+    metric_col = columns[-1]
+    read_kwargs = {}
+    if 'LocalTimestamp' in columns and metric_col != 'LocalTimestamp':
+        read_kwargs = {
+            'usecols': ['LocalTimestamp', metric_col],
+            'dtype': {'LocalTimestamp': 'float64', metric_col: 'float64'}
+        }
+    
+    if _METRIC_CSV_ENGINE == 'pyarrow':
+        try:
+            return pd.read_csv(path, engine='pyarrow', **read_kwargs)
+        except ValueError as e:
+            logger.warning(f"pyarrow could not parse {path} ({e}) - using C parser")
+    try:
+        return pd.read_csv(path, engine='c', **read_kwargs)
+    except ValueError as e:
+        # Non-numeric metric column: load it as-is
+        logger.warning(f"Could not read {path} as numeric ({e}) - loading all columns")
+        return pd.read_csv(path)
+
+
+def read_csv_files_concurrently(paths, max_workers=None, reader=pd.read_csv):
+    """
+    Read several CSV files on a thread pool.
+    
+    Args:
+        paths: List of CSV file paths
+        max_workers: Thread count (default: min(8, number of files))
+        reader: Function used to read one file (default: pd.read_csv)
+        
+    Returns:
+        Dict mapping each path to its DataFrame
+    """
+    unique_paths = list(dict.fromkeys(paths))
+    if len(unique_paths) <= 1:
+        return {path: reader(path) for path in unique_paths}
+    
+    workers = max_workers or min(8, len(unique_paths))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        frames = pool.map(reader, unique_paths)
+        return dict(zip(unique_paths, frames))
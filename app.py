@@ -10,6 +10,12 @@ import io
 from datetime import datetime
 import numpy as np
 import subprocess
+import logging
+
+try:
+    import orjson  # optional, serializes the (large) analysis results faster
+except ImportError:
+    orjson = None
 
 from analysis_utils import (
     prepare_event_markers_timestamps,
@@ -18,6 +24,15 @@ from analysis_utils import (
 )
 from analysis_runner import run_analysis
 
+# Analysis progress is reported through the logging module; set
+# ANALYSIS_LOG_LEVEL=DEBUG for per-group/per-file detail, or WARNING to keep
+# only warnings and errors
+logging.basicConfig(
+    level=os.environ.get('ANALYSIS_LOG_LEVEL', 'INFO').upper(),
+    format='%(message)s',
+    handlers=[logging.StreamHandler()]
+)
+
 app = Flask(__name__, static_folder='frontend/build', static_url_path='')
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max
 CORS(app)
@@ -36,6 +51,16 @@ STUDENTS_FILE = 'data/students.json'
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def _json_response(payload, status=200):
+    """
+    jsonify() that uses orjson when it is installed. Keys are sorted like
+    Flask's default JSON provider so responses are unchanged.
+    """
+    if orjson is None:
+        return jsonify(payload), status
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+    return app.response_class(body, status=status, mimetype='application/json')
+
 def load_students():
     """Load students from JSON file"""
     if os.path.exists(STUDENTS_FILE):
@@ -554,14 +579,18 @@ def upload_folder_and_analyze():
         results = clean_nan(results)
         results_path = os.path.join(OUTPUT_FOLDER, 'results.json')
 
-        with open(results_path, 'w') as f:
-            json.dump(results, f, indent=2)
+        if orjson is not None:
+            with open(results_path, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(results_path, 'w') as f:
+                json.dump(results, f, indent=2)
         
-        return jsonify({
+        return _json_response({
             'message': 'Analysis completed successfully',
             'results': results,
             'folder_name': folder_name
-        }), 200
+        })
         
     except Exception as e:
         error_msg = f"Error: {str(e)}"
@@ -579,14 +608,15 @@ def serve_plot(filename):
         filename (str): The name of the plot image file to serve.
         
     Returns:
-        Response: If the file exists, returns the image file with 'image/png' MIME type.
+        Response: If the file exists, returns the image file with the MIME type of its
+                  extension ('image/png' or 'image/svg+xml').
                   If the file does not exist, returns a JSON error message with a 404 status code.
                   If an exception occurs, returns a JSON error message with a 500 status code.
     """
     try:
         file_path = os.path.join(OUTPUT_FOLDER, filename)
         if os.path.exists(file_path):
-            return send_file(file_path, mimetype='image/png')
+            return send_file(file_path)
         else:
             return jsonify({'error': 'Plot not found'}), 404
     except Exception as e:
@@ -607,13 +637,13 @@ def get_results():
     try:
         results_path = os.path.join(OUTPUT_FOLDER, 'results.json')
         if os.path.exists(results_path):
-            with open(results_path, 'r') as f:
-                results = json.load(f)
+            with open(results_path, 'rb') as f:
+                results = orjson.loads(f.read()) if orjson is not None else json.load(f)
             
             for plot in results.get('plots', []):
                 plot['url'] = f"/api/plot/{plot['filename']}"
             
-            return jsonify(results), 200
+            return _json_response(results)
         else:
             return jsonify({'error': 'No results available'}), 404
     except Exception as e:
@@ -623,11 +653,11 @@ def get_results():
 @app.route('/api/save_images', methods=['POST'])
 def save_images():
     """
-    Saves PNG images from the output folder to a specified target folder.
+    Saves plot images (PNG and SVG) from the output folder to a specified target folder.
     
     This route expects a JSON payload containing a 'folder_name' key. It creates a target folder 
     under 'data/' using the provided folder name (sanitized for security), and copies all PNG 
-    images from the OUTPUT_FOLDER to the target folder. If the folder does not exist, it will be created.
+    and SVG images from the OUTPUT_FOLDER to the target folder. If the folder does not exist, it will be created.
     
     Returns:
         JSON response with a success message and HTTP 200 status code if images are saved successfully.
@@ -640,7 +670,7 @@ def save_images():
         os.makedirs(target_folder, exist_ok=True)
         
         for filename in os.listdir(OUTPUT_FOLDER):
-            if filename.endswith('.png'):
+            if filename.endswith(('.png', '.svg')):
                 src_path = os.path.join(OUTPUT_FOLDER, filename)
                 dst_path = os.path.join(target_folder, filename)
                 shutil.copy2(src_path, dst_path)
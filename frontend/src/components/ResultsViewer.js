@@ -110,6 +110,15 @@ function ResultsViewer() {
     );
   }
 
+  // Single-subject runs return one HRV result; batch runs return one per subject
+  const hrvEntries = results.hrv_by_subject
+    ? Object.entries(results.hrv_by_subject)
+    : results.hrv ? [['', results.hrv]] : [];
+
+  // Batch-mode HRV plot names end with "(<subject>)"
+  const isHrvPlotFor = (plot, subject) =>
+    plot.filename.startsWith('HRV_') && (!subject || plot.name.endsWith(`(${subject})`));
+
   return (
     <div className="results-viewer-container">
       <div className="results-header-section no-print">
@@ -130,36 +139,36 @@ function ResultsViewer() {
       </div>
 
       <div className="results-container">
-        {/* HRV Analysis Results */}
-        {results.hrv && (
-          <div className="result-card hrv-card">
-            <h2 className="card-title">HRV Analysis</h2>
+        {/* HRV Analysis Results - one card per subject in batch mode */}
+        {hrvEntries.map(([subject, hrv]) => (
+          <div key={subject || 'hrv'} className="result-card hrv-card">
+            <h2 className="card-title">{subject ? `HRV Analysis - ${subject}` : 'HRV Analysis'}</h2>
             
             <div className="hrv-summary">
               <h3 className="section-title">Summary Statistics</h3>
               <div className="stats-grid">
                 <div className="stat-card">
                   <div className="stat-label">Peaks Detected</div>
-                  <div className="stat-value">{results.hrv.num_peaks}</div>
+                  <div className="stat-value">{hrv.num_peaks}</div>
                 </div>
                 <div className="stat-card">
                   <div className="stat-label">Duration</div>
-                  <div className="stat-value">{results.hrv.duration_minutes.toFixed(2)}</div>
+                  <div className="stat-value">{hrv.duration_minutes.toFixed(2)}</div>
                   <div className="stat-detail">minutes</div>
                 </div>
                 <div className="stat-card">
                   <div className="stat-label">Average HR</div>
-                  <div className="stat-value">{results.hrv.average_hr_bpm.toFixed(2)}</div>
+                  <div className="stat-value">{hrv.average_hr_bpm.toFixed(2)}</div>
                   <div className="stat-detail">bpm</div>
                 </div>
               </div>
             </div>
 
-            {results.hrv.indices && Object.keys(results.hrv.indices).length > 0 && (
+            {hrv.indices && Object.keys(hrv.indices).length > 0 && (
               <div className="hrv-indices">
                 <h3 className="section-title">HRV Indices</h3>
                 <div className="indices-grid">
-                  {Object.entries(results.hrv.indices).map(([key, value]) => (
+                  {Object.entries(hrv.indices).map(([key, value]) => (
                     <div key={key} className="index-item">
                       <span className="index-name">{key}:</span>
                       <span className="index-value">
@@ -173,14 +182,14 @@ function ResultsViewer() {
               </div>
             )}
 
-            {results.plots?.filter(p => p.filename.startsWith('HRV_')).map((plot, idx) => (
+            {results.plots?.filter(p => isHrvPlotFor(p, subject)).map((plot, idx) => (
               <div key={idx} className="plot-container">
                 <h4 className="plot-title">{plot.name}</h4>
                 <img src={plot.url} alt={plot.name} className="plot-image" />
               </div>
             ))}
           </div>
-        )}
+        ))}
         {/* Analysis Results */}
         {results.analysis && Object.keys(results.analysis).length > 0 && (
         <div className="result-card">
@@ -1,8 +1,14 @@
-import matplotlib.pyplot as plt
 import matplotlib
 matplotlib.use('Agg')
+from matplotlib.figure import Figure
 import numpy as np
 import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Plots are drawn on standalone Figure objects rather than through pyplot's
+# global figure manager, so several plots can be rendered on worker threads.
 
 def generate_plot(group_data, metric_col, metric, plot_type, analysis_method, 
                   output_folder, suffix='', subject_label=''):
@@ -20,7 +26,7 @@ def generate_plot(group_data, metric_col, metric, plot_type, analysis_method,
     elif plot_type == 'barchart':
         return None  # Handled by generate_comparison_plot
     else:
-        print(f"Warning: Unknown plot type '{plot_type}', defaulting to lineplot")
+        logger.warning(f"Unknown plot type '{plot_type}', defaulting to lineplot")
         return generate_lineplot(group_data, metric_col, metric, analysis_method, output_folder, suffix, subject_label)
 
 
@@ -32,7 +38,8 @@ def generate_lineplot(group_data, metric_col, metric, analysis_method, output_fo
               '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#E91E63']
     
     num_groups = len(group_data)
-    fig, axes = plt.subplots(num_groups, 1, figsize=(14, 4 * num_groups), squeeze=False)
+    fig = Figure(figsize=(14, 4 * num_groups))
+    axes = fig.subplots(num_groups, 1, squeeze=False)
     
     for idx, (group_label, data) in enumerate(group_data.items()):
         ax = axes[idx, 0]
@@ -41,7 +48,7 @@ def generate_lineplot(group_data, metric_col, metric, analysis_method, output_fo
         if len(values) == 0:
             continue
         
-        timestamps = data['AdjustedTimestamp'].values
+        timestamps = data['AdjustedTimestamp'].to_numpy()
         
         # Ensure timestamps and values have matching lengths (RMSSD produces N-1 points)
         min_len = min(len(timestamps), len(values))
@@ -75,7 +82,7 @@ def generate_lineplot(group_data, metric_col, metric, analysis_method, output_fo
         ax.grid(True, alpha=0.3, linestyle='--')
         ax.legend(loc='upper left', fontsize=9)
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Add subject label at bottom if provided
     if subject_label:
@@ -84,10 +91,9 @@ def generate_lineplot(group_data, metric_col, metric, analysis_method, output_fo
     
     filename = f'{metric}_lineplot{suffix}.png'
     plot_path = os.path.join(output_folder, filename)
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    fig.savefig(plot_path, dpi=100, bbox_inches='tight')
     
-    print(f"Saved: {filename}")
+    logger.info(f"Saved: {filename}")
     
     return {
         'name': f'{metric} Line Plot',
@@ -104,13 +110,14 @@ def generate_boxplot(group_data, metric_col, metric, analysis_method, output_fol
     colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', 
               '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#E91E63']
     
-    fig, ax = plt.subplots(figsize=(max(10, len(group_data) * 2), 6))
+    fig = Figure(figsize=(max(10, len(group_data) * 2), 6))
+    ax = fig.subplots()
     
     group_labels = list(group_data.keys())
     data_arrays = []
     
     for group_label in group_labels:
-        values = group_data[group_label][metric_col].dropna().values
+        values = group_data[group_label][metric_col].dropna().to_numpy()
         data_arrays.append(values)
     
     # Create box plot
@@ -121,7 +128,7 @@ def generate_boxplot(group_data, metric_col, metric, analysis_method, output_fol
                         medianprops=dict(color='black', linewidth=2))
     except ValueError as e:
         # Fallback to non-notched boxplot if insufficient data
-        print(f"Notched boxplot failed, using standard boxplot: {e}")
+        logger.warning(f"Notched boxplot failed, using standard boxplot: {e}")
         bp = ax.boxplot(data_arrays, labels=group_labels, patch_artist=True,
                         notch=False, showmeans=True,
                         meanprops=dict(marker='D', markerfacecolor='red', markersize=8),
@@ -139,9 +146,11 @@ def generate_boxplot(group_data, metric_col, metric, analysis_method, output_fol
     
     # Rotate x labels if needed
     if len(group_labels) > 3:
-        plt.xticks(rotation=45, ha='right')
+        for tick_label in ax.get_xticklabels():
+            tick_label.set_rotation(45)
+            tick_label.set_horizontalalignment('right')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Add subject label at bottom if provided
     if subject_label:
@@ -150,10 +159,9 @@ def generate_boxplot(group_data, metric_col, metric, analysis_method, output_fol
     
     filename = f'{metric}_boxplot{suffix}.png'
     plot_path = os.path.join(output_folder, filename)
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    fig.savefig(plot_path, dpi=100, bbox_inches='tight')
     
-    print(f"Saved: {filename}")
+    logger.info(f"Saved: {filename}")
     
     return {
         'name': f'{metric} Box Plot',
@@ -169,13 +177,14 @@ def generate_scatter(group_data, metric_col, metric, analysis_method, output_fol
     """
     # Scatter plots require multiple data points - incompatible with mean analysis
     if analysis_method == 'mean':
-        print(f"Scatter plot requires multiple data points (mean analysis produces single value)")
+        logger.warning(f"Scatter plot requires multiple data points (mean analysis produces single value)")
         return None
     
     colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', 
               '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#E91E63']
     
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig = Figure(figsize=(14, 8))
+    ax = fig.subplots()
     
     for idx, (group_label, data) in enumerate(group_data.items()):
         values = data[metric_col].dropna()
@@ -183,7 +192,7 @@ def generate_scatter(group_data, metric_col, metric, analysis_method, output_fol
         if len(values) == 0:
             continue
         
-        timestamps = data['AdjustedTimestamp'].values
+        timestamps = data['AdjustedTimestamp'].to_numpy()
         start_time = timestamps.min()
         elapsed_seconds = timestamps - start_time
         
@@ -206,7 +215,7 @@ def generate_scatter(group_data, metric_col, metric, analysis_method, output_fol
     ax.set_title(f'{metric} Scatter Plot', fontsize=14, fontweight='bold')
     ax.legend(fontsize=10, loc='best')
     ax.grid(True, alpha=0.3, linestyle='--')
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Add subject label at bottom if provided
     if subject_label:
@@ -215,10 +224,9 @@ def generate_scatter(group_data, metric_col, metric, analysis_method, output_fol
     
     filename = f'{metric}_scatter{suffix}.png'
     plot_path = os.path.join(output_folder, filename)
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    fig.savefig(plot_path, dpi=100, bbox_inches='tight')
     
-    print(f"Saved: {filename}")
+    logger.info(f"Saved: {filename}")
     
     return {
         'name': f'{metric} Scatter Plot',
@@ -236,10 +244,11 @@ def generate_poincare(group_data, metric_col, metric, analysis_method, output_fo
     colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', 
               '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#E91E63']
     
-    fig, ax = plt.subplots(figsize=(10, 10))
+    fig = Figure(figsize=(10, 10))
+    ax = fig.subplots()
     
     for idx, (group_label, data) in enumerate(group_data.items()):
-        values = data[metric_col].dropna().values
+        values = data[metric_col].dropna().to_numpy()
         
         if len(values) < 2:
             continue
@@ -273,7 +282,7 @@ def generate_poincare(group_data, metric_col, metric, analysis_method, output_fo
     ax.legend(fontsize=9, loc='best')
     ax.grid(True, alpha=0.3, linestyle='--')
     ax.set_aspect('equal')
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Add subject label at bottom if provided
     if subject_label:
@@ -282,10 +291,9 @@ def generate_poincare(group_data, metric_col, metric, analysis_method, output_fo
     
     filename = f'{metric}_poincare{suffix}.png'
     plot_path = os.path.join(output_folder, filename)
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    fig.savefig(plot_path, dpi=100, bbox_inches='tight')
     
-    print(f"Saved: {filename}")
+    logger.info(f"Saved: {filename}")
     
     return {
         'name': f'{metric} Poincaré Plot',
@@ -302,7 +310,8 @@ def generate_comparison_plot(metric_results, metric, analysis_method, output_fol
     colors = ['#4CAF50', '#2196F3', '#FF9800', '#9C27B0', '#F44336', 
               '#00BCD4', '#FFEB3B', '#795548', '#607D8B', '#E91E63']
     
-    fig, ax = plt.subplots(figsize=(max(10, len(metric_results) * 2), 6))
+    fig = Figure(figsize=(max(10, len(metric_results) * 2), 6))
+    ax = fig.subplots()
     
     group_labels = list(metric_results.keys())
     
@@ -333,7 +342,7 @@ def generate_comparison_plot(metric_results, metric, analysis_method, output_fol
         ax.text(i, mean + std + 0.05 * max(means), f'{mean:.2f}±{std:.2f}',
             ha='center', va='bottom', fontsize=9, fontweight='bold')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Add subject label at bottom if provided
     if subject_label:
@@ -342,10 +351,9 @@ def generate_comparison_plot(metric_results, metric, analysis_method, output_fol
     
     filename = f'{metric}_comparison{suffix}.png'
     plot_path = os.path.join(output_folder, filename)
-    plt.savefig(plot_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    fig.savefig(plot_path, dpi=100, bbox_inches='tight')
     
-    print(f"Saved: {filename}")
+    logger.info(f"Saved: {filename}")
     
     return {
         'name': f'{metric} Statistical Comparison',
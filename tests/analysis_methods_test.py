@@ -0,0 +1,99 @@
+"""
+The grouped analysis paths must give the same frames and statistics as
+applying apply_analysis_method() and calculate_statistics() group by group.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_methods import (
+    apply_analysis_method,
+    apply_group_analysis_method,
+    calculate_statistics,
+    calculate_group_statistics,
+    calculate_group_method_statistics
+)
+
+METHODS = ['raw', 'mean', 'moving_average', 'rmssd']
+
+# apply_rmssd() on a single-sample window averages an empty diff
+pytestmark = pytest.mark.filterwarnings('ignore::RuntimeWarning')
+
+
+def make_group_data(seed=0):
+    """Windows of varied lengths, including single-sample and gapped ones."""
+    rng = np.random.default_rng(seed)
+    group_data = {}
+    for label, n in [('baseline', 120), ('task', 45), ('single', 1), ('pair', 2), ('recovery', 300)]:
+        values = rng.normal(70, 5, n)
+        if n > 10:
+            values[rng.integers(0, n, 3)] = np.nan
+        group_data[label] = pd.DataFrame({
+            'LocalTimestamp': np.arange(n, dtype=float),
+            'HR': values,
+            'AdjustedTimestamp': 1_700_000_000 + np.arange(n, dtype=float)
+        })
+    return group_data
+
+
+def assert_stats_equal(actual, expected):
+    assert list(actual) == list(expected)
+    for label in expected:
+        assert actual[label].keys() == expected[label].keys(), label
+        for key, value in expected[label].items():
+            assert actual[label][key] == pytest.approx(value, rel=1e-9, abs=1e-12, nan_ok=True), (label, key)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_apply_group_analysis_method_matches_per_group(method):
+    group_data = make_group_data()
+
+    grouped = apply_group_analysis_method(group_data, 'HR', method)
+
+    assert list(grouped) == list(group_data)
+    for label, data in group_data.items():
+        expected = apply_analysis_method(data, 'HR', method)
+        pd.testing.assert_frame_equal(
+            grouped[label].reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_dtype=False,
+            rtol=1e-9
+        )
+        if method == 'rmssd':
+            assert grouped[label].attrs.get('rmssd') == pytest.approx(expected.attrs.get('rmssd'), nan_ok=True)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_calculate_group_statistics_matches_per_group(method):
+    processed = {
+        label: apply_analysis_method(data, 'HR', method)
+        for label, data in make_group_data().items()
+    }
+
+    expected = {label: calculate_statistics(data, 'HR', method) for label, data in processed.items()}
+
+    assert_stats_equal(calculate_group_statistics(processed, 'HR', method), expected)
+
+
+@pytest.mark.parametrize('method', METHODS)
+def test_calculate_group_method_statistics_matches_apply_then_calculate(method):
+    group_data = make_group_data(seed=1)
+
+    expected = {}
+    for label, data in group_data.items():
+        processed = apply_analysis_method(data, 'HR', method)
+        expected[label] = calculate_statistics(processed, 'HR', method)
+
+    assert_stats_equal(calculate_group_method_statistics(group_data, 'HR', method), expected)
+
+
+def test_group_statistics_of_empty_input():
+    assert calculate_group_statistics({}, 'HR') == {}
+    assert calculate_group_method_statistics({}, 'HR', 'mean') == {}
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        apply_group_analysis_method(make_group_data(), 'HR', 'median')
+    with pytest.raises(ValueError):
+        calculate_group_method_statistics(make_group_data(), 'HR', 'median')
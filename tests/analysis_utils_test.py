@@ -0,0 +1,109 @@
+"""
+extract_windows_batch() must return, for every window configuration, the
+rows a boolean mask over the adjusted timestamps selects per occurrence.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_utils import extract_windows_batch
+
+OFFSET = 12.5
+
+
+def masked_window(emotibit_df, event_markers_df, offset, window_config):
+    """Reference: one boolean mask per marker occurrence."""
+    emotibit_df = emotibit_df.copy()
+    emotibit_df['AdjustedTimestamp'] = emotibit_df['LocalTimestamp'] + offset
+
+    if window_config['eventMarker'] == 'all':
+        return emotibit_df
+
+    marker_rows = event_markers_df[event_markers_df['event_marker'] == window_config['eventMarker']]
+    if window_config.get('conditionMarker'):
+        marker_rows = marker_rows[marker_rows['condition'] == window_config['conditionMarker']]
+
+    all_data = []
+    for marker_time in marker_rows['unix_timestamp']:
+        adjusted = emotibit_df['AdjustedTimestamp']
+        if window_config['timeWindowType'] == 'full':
+            next_markers = event_markers_df[
+                (event_markers_df['unix_timestamp'] > marker_time) &
+                (event_markers_df['event_marker'].notna()) &
+                (event_markers_df['event_marker'] != '')
+            ]
+            if len(next_markers) > 0:
+                end_time = next_markers.iloc[0]['unix_timestamp']
+            else:
+                end_time = event_markers_df['unix_timestamp'].max()
+            window_data = emotibit_df[(adjusted >= marker_time) & (adjusted < end_time)]
+        else:
+            window_data = emotibit_df[
+                (adjusted >= marker_time + window_config['customStart']) &
+                (adjusted <= marker_time + window_config['customEnd'])
+            ]
+        if len(window_data) > 0:
+            all_data.append(window_data)
+
+    if len(all_data) == 0:
+        return pd.DataFrame()
+    return pd.concat(all_data, ignore_index=True)
+
+
+def make_markers():
+    return pd.DataFrame({
+        'unix_timestamp': [1000.0, 1060.0, 1090.0, 1150.0, 1200.0, 1260.0],
+        'event_marker': ['baseline', 'task', '', 'task', 'recovery', 'end'],
+        'condition': ['rest', 'A', '', 'B', 'rest', '']
+    })
+
+
+def make_metric(shuffled=False):
+    rng = np.random.default_rng(0)
+    # Sampled at 4 Hz in marker time, shifted back by OFFSET
+    local = 990.0 - OFFSET + np.arange(1200) * 0.25
+    data = pd.DataFrame({'LocalTimestamp': local, 'HR': rng.normal(70, 5, len(local))})
+    if shuffled:
+        data = data.sample(frac=1, random_state=1).reset_index(drop=True)
+    return data
+
+
+WINDOW_CONFIGS = [
+    {'label': 'all', 'eventMarker': 'all', 'timeWindowType': 'full'},
+    {'label': 'baseline', 'eventMarker': 'baseline', 'timeWindowType': 'full'},
+    {'label': 'task', 'eventMarker': 'task', 'timeWindowType': 'full'},
+    {'label': 'task A', 'eventMarker': 'task', 'conditionMarker': 'A', 'timeWindowType': 'full'},
+    {'label': 'last', 'eventMarker': 'end', 'timeWindowType': 'full'},
+    {'label': 'pre-task', 'eventMarker': 'task', 'timeWindowType': 'custom',
+     'customStart': -30.0, 'customEnd': 0.0},
+    {'label': 'exact edges', 'eventMarker': 'recovery', 'timeWindowType': 'custom',
+     'customStart': 0.0, 'customEnd': 10.0},
+    {'label': 'missing', 'eventMarker': 'no such marker', 'timeWindowType': 'full'},
+    {'label': 'out of range', 'eventMarker': 'baseline', 'timeWindowType': 'custom',
+     'customStart': -500.0, 'customEnd': -400.0},
+]
+
+
+@pytest.mark.parametrize('shuffled', [False, True])
+def test_extract_windows_batch_matches_masks(shuffled):
+    emotibit_df = make_metric(shuffled)
+    markers = make_markers()
+
+    windows = extract_windows_batch(emotibit_df, markers, OFFSET, WINDOW_CONFIGS)
+
+    assert len(windows) == len(WINDOW_CONFIGS)
+    for window_config, window in zip(WINDOW_CONFIGS, windows):
+        expected = masked_window(emotibit_df, markers, OFFSET, window_config)
+        if len(expected) == 0:
+            assert len(window) == 0, window_config['label']
+            continue
+        pd.testing.assert_frame_equal(window, expected, obj=window_config['label'])
+
+
+def test_extract_windows_batch_leaves_input_unchanged():
+    emotibit_df = make_metric()
+    before = emotibit_df.copy()
+
+    extract_windows_batch(emotibit_df, make_markers(), OFFSET, WINDOW_CONFIGS)
+
+    pd.testing.assert_frame_equal(emotibit_df, before)
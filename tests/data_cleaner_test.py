@@ -0,0 +1,88 @@
+"""
+BiometricDataCleaner.clean_arrays() must keep exactly the samples clean()
+keeps, with the same values, and report removed samples as NaN in place.
+"""
+import itertools
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataCleaner import BiometricDataCleaner
+
+STAGE_NAMES = [
+    'remove_invalid',
+    'remove_physiological_outliers',
+    'remove_statistical_outliers',
+    'remove_sudden_changes',
+    'interpolate',
+    'smooth'
+]
+ALL_STAGES = [dict(zip(STAGE_NAMES, flags)) for flags in itertools.product([True, False], repeat=6)]
+
+
+def make_series(seed, n=200):
+    """Strictly increasing timestamps and values with NaN, inf and outliers."""
+    rng = np.random.default_rng(seed)
+    timestamps = 1_700_000_000 + np.cumsum(rng.uniform(0.5, 3, n))
+    values = rng.normal(15, 6, n)
+    values[rng.integers(0, n, 10)] = np.nan
+    values[rng.integers(0, n, 3)] = np.inf
+    values[rng.integers(0, n, 3)] = -5
+    return timestamps, values
+
+
+def clean_dataframe(cleaner, timestamps, values, stages):
+    data = pd.DataFrame({'LocalTimestamp': timestamps, 'value': values})
+    with warnings.catch_warnings():
+        # clean() still uses the deprecated fillna(method=...)
+        warnings.simplefilter('ignore', FutureWarning)
+        return cleaner.clean(data, 'value', timestamp_col='LocalTimestamp', stages=stages)
+
+
+@pytest.mark.parametrize('metric_type', ['HR', 'RR', 'EDA', 'default'])
+@pytest.mark.parametrize('seed', range(3))
+def test_clean_arrays_matches_clean(metric_type, seed):
+    cleaner = BiometricDataCleaner(metric_type)
+    timestamps, values = make_series(seed)
+
+    for stages in ALL_STAGES:
+        expected = clean_dataframe(cleaner, timestamps, values, stages)
+        cleaned = cleaner.clean_arrays(values, timestamps, stages=stages)
+
+        assert len(cleaned) == len(values)
+        kept = ~np.isnan(cleaned)
+        np.testing.assert_array_equal(timestamps[kept], expected['LocalTimestamp'].to_numpy(), err_msg=str(stages))
+        np.testing.assert_allclose(cleaned[kept], expected['value'].to_numpy(), rtol=1e-12, err_msg=str(stages))
+
+
+def test_clean_arrays_default_stages_match_clean():
+    cleaner = BiometricDataCleaner('HR')
+    timestamps, values = make_series(0)
+    expected = clean_dataframe(cleaner, timestamps, values, None)
+    cleaned = cleaner.clean_arrays(values, timestamps)
+    np.testing.assert_allclose(cleaned[~np.isnan(cleaned)], expected['value'].to_numpy())
+
+
+def test_clean_arrays_marks_removed_samples_in_place():
+    cleaner = BiometricDataCleaner('HR')
+    timestamps = np.array([0.0, 1.0, 2.0, 3.0])
+    values = np.array([70.0, 500.0, 72.0, np.nan])
+    stages = {'remove_sudden_changes': False, 'interpolate': False}
+
+    cleaned = cleaner.clean_arrays(values, timestamps, stages=stages)
+
+    np.testing.assert_array_equal(cleaned, [70.0, np.nan, 72.0, np.nan])
+    # The input array is left untouched
+    assert values[1] == 500.0
+
+
+def test_clean_arrays_keeps_input_order_for_unsorted_timestamps():
+    cleaner = BiometricDataCleaner('default')
+    timestamps = np.array([3.0, 1.0, 2.0])
+    values = np.array([30.0, 10.0, 20.0])
+
+    cleaned = cleaner.clean_arrays(values, timestamps)
+
+    np.testing.assert_array_equal(cleaned, values)